@@ -168,7 +168,7 @@ async def get_element_types(active_only: bool = True, category: Optional[str] =
                 description=spec.description,
                 category=spec.category,
                 calculator_type=spec.calculator_type.value,
-                specification=spec.specification,
+                specification=dict(spec.specification),
                 active=spec.active
             ))
         
@@ -195,7 +195,7 @@ async def get_element_type(code: str):
             description=spec.description,
             category=spec.category,
             calculator_type=spec.calculator_type.value,
-            specification=spec.specification,
+            specification=dict(spec.specification),
             active=spec.active
         )
     except HTTPException:
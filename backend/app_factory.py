@@ -0,0 +1,336 @@
+"""
+Shared FastAPI application setup for main.py (local) and main_vercel.py (Vercel)
+
+Both entry points used to carry their own copy of the middleware, exception
+handler, router registration and debug endpoints. create_app builds the app
+for either mode; only the differences between the two live in _MODES.
+"""
+from typing import Literal
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from utils.error_logger import log_error, log_info
+from utils.request_logging import RequestLogMiddleware
+import functools
+import importlib
+import traceback
+import signal
+import sys
+import os
+import json
+import time
+
+# orjson is optional; without it the pre-serialized bodies use the stdlib encoder.
+# Router responses always go through FastAPI's default JSONResponse
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Routers as (name, module, prefix, tag, label). Modules are imported by name so a
+# deployment can skip the ones it does not serve: ENABLED_ROUTERS is a
+# comma-separated list of router names, and empty (the default) enables them all.
+# The pdf entry's module and label come from the mode
+ROUTER_SPECS = (
+    ("calculations", "calculations", "/api/calculations", "calculations", "Calculations router"),
+    ("materials", "materials", "/api/materials", "materials", "Materials router"),
+    ("projects", "projects", "/api/projects", "projects", "Projects router"),
+    ("pdf", None, "/api/pdf", "pdf", None),
+    ("debug", "debug", "/api/debug", "debug", "Debug router"),
+    ("agents", "agents", "/api/agents", "agents", "Agents router"),
+)
+ENABLED_ROUTERS = {name.strip() for name in os.getenv("ENABLED_ROUTERS", "").split(",") if name.strip()}
+
+_MODES = {
+    "local": {
+        "banner": "=== BACKEND STARTING ===",
+        "ready_banner": "=== BACKEND READY ===",
+        "imported": "  ✓ All routers imported successfully",
+        "title": "Building Measurements API",
+        "description": "Construction material calculation assistant for Australian residential projects",
+        "allow_origins": ["http://localhost:3000"],  # React development server
+        "pdf_module": "pdf_processing",
+        "pdf_label": "PDF processing router",
+        "extra": {},
+    },
+    "vercel": {
+        "banner": "=== BACKEND STARTING (VERCEL MODE) ===",
+        "ready_banner": "=== BACKEND READY (VERCEL) ===",
+        "imported": "  ✓ All routers imported successfully (Vercel mode)",
+        "title": "Building Measurements API (Vercel)",
+        "description": "Construction material calculation assistant for Australian residential projects - Vercel deployment",
+        "allow_origins": ["*"],  # Allow all origins for Vercel deployment
+        "pdf_module": "pdf_processing_vercel",
+        "pdf_label": "PDF processing router (Vercel compatible)",
+        "extra": {"deployment": "vercel"},
+    },
+}
+
+
+def _dumps(content) -> bytes:
+    """Serialize a JSON body with orjson when available, compact stdlib JSON otherwise"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+# Constant bodies for / and the local /health, serialized once at import;
+# health is polled by every liveness probe
+_LOCAL_ROOT_BODY = _dumps({"message": "Building Measurements API is running"})
+_VERCEL_ROOT_BODY = _dumps({
+    "message": "Building Measurements API is running",
+    "deployment": "vercel",
+    "features": {
+        "calculations": "available",
+        "materials": "available",
+        "pdf_processing": "limited",
+        "agents": "available"
+    }
+})
+_HEALTH_BODY = _dumps({"status": "healthy"})
+
+
+def _ttl_cached_json(seconds: float):
+    """
+    Cache a parameterless async handler's JSON body for a short time
+    
+    The handler returns plain content; it is serialized once per window and
+    served as raw bytes until the window expires, which absorbs bursts of
+    load balancer and liveness probes.
+    """
+    def decorator(handler):
+        body = None
+        expires_at = 0.0
+        
+        @functools.wraps(handler)
+        async def wrapper():
+            nonlocal body, expires_at
+            now = time.monotonic()
+            if body is None or now >= expires_at:
+                body = _dumps(await handler())
+                expires_at = now + seconds
+            return Response(content=body, media_type="application/json")
+        
+        return wrapper
+    return decorator
+
+
+def _import_routers(config: dict) -> dict:
+    """Import the enabled router modules, exiting if any of them fails"""
+    print("\n✓ Importing routers...")
+    routers = {}
+    try:
+        for name, module_name, *_ in ROUTER_SPECS:
+            if not ENABLED_ROUTERS or name in ENABLED_ROUTERS:
+                module_name = module_name or config["pdf_module"]
+                routers[name] = importlib.import_module(f"api.routers.{module_name}")
+        print(config["imported"])
+    except Exception as e:
+        print(f"  ✗ ERROR importing routers: {e}")
+        traceback.print_exc()
+        sys.exit(1)
+    return routers
+
+
+def _register_signal_handlers() -> None:
+    """Log the signals that stop the local server"""
+    # Set up signal handlers to understand shutdowns
+    def signal_handler(sig, frame):
+        sig_names = {
+            signal.SIGINT: "SIGINT (Ctrl+C)",
+            signal.SIGTERM: "SIGTERM (Termination)",
+            signal.SIGHUP: "SIGHUP (Hangup)",
+            signal.SIGUSR1: "SIGUSR1 (User-defined 1)",
+            signal.SIGUSR2: "SIGUSR2 (User-defined 2)",
+            signal.SIGKILL: "SIGKILL (Kill)",
+            signal.SIGQUIT: "SIGQUIT (Quit)"
+        }
+        sig_name = sig_names.get(sig, f"Unknown signal {sig}")
+        print(f"\n[SIGNAL] Received signal: {sig_name}")
+        log_info(f"Received signal: {sig_name} - Backend shutting down", "main.signal_handler")
+        
+        # Don't call sys.exit() here - let uvicorn handle the shutdown properly
+        # Just log that we received the signal
+    
+    # Register signal handlers
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGHUP, signal_handler)
+    log_info("Signal handlers registered", "main.startup")
+
+
+def create_app(mode: Literal["local", "vercel"] = "local") -> FastAPI:
+    """
+    Build the API application for the local server or the Vercel deployment
+    
+    Args:
+        mode: "local" for main.py, "vercel" for main_vercel.py
+    
+    Returns:
+        Configured FastAPI app with middleware, handlers and routers mounted
+    """
+    config = _MODES[mode]
+    vercel = mode == "vercel"
+    extra = config["extra"]
+    
+    print("\n" + "="*50)
+    print(config["banner"])
+    print("="*50)
+    print(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"PID: {os.getpid()}")
+    
+    routers = _import_routers(config)
+    
+    app = FastAPI(
+        title=config["title"],
+        description=config["description"],
+        version="1.0.0"
+    )
+    
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=config["allow_origins"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # Add request logging middleware
+    app.add_middleware(RequestLogMiddleware)
+    
+    # Global exception handler to prevent server crashes
+    @app.exception_handler(Exception)
+    async def global_exception_handler(request: Request, exc: Exception):
+        """Catch all unhandled exceptions to prevent server crashes"""
+        error_id = log_error(exc, "global_exception_handler", additional_info={
+            "path": request.url.path,
+            "method": request.method,
+            "traceback": traceback.format_exc()
+        })
+        
+        return JSONResponse(
+            status_code=500,
+            content={
+                "detail": f"Internal server error: {str(exc)}",
+                "error_id": error_id,
+                "path": request.url.path,
+                **extra
+            }
+        )
+    
+    # Include routers with logging
+    print("\n✓ Registering routers...")
+    try:
+        for name, _, prefix, tag, label in ROUTER_SPECS:
+            if name in routers:
+                app.include_router(routers[name].router, prefix=prefix, tags=[tag])
+                print(f"  ✓ {label or config['pdf_label']} registered at {prefix}")
+    
+    except Exception as e:
+        print(f"\n✗ ERROR registering routers: {e}")
+        traceback.print_exc()
+    
+    if vercel:
+        @app.get("/")
+        async def root():
+            return Response(content=_VERCEL_ROOT_BODY, media_type="application/json")
+        
+        @app.get("/health")
+        @_ttl_cached_json(seconds=1.0)
+        async def health_check():
+            # Only the timestamp changes, and only once a second
+            return {
+                "status": "healthy",
+                "deployment": "vercel",
+                "timestamp": time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+    else:
+        @app.get("/")
+        async def root():
+            return Response(content=_LOCAL_ROOT_BODY, media_type="application/json")
+        
+        @app.get("/health")
+        async def health_check():
+            return Response(content=_HEALTH_BODY, media_type="application/json")
+    
+    # Route listing for /debug/routes; routes do not change once the app is serving,
+    # so it is built and serialized once
+    routes_cache = None
+    
+    def get_routes_listing():
+        """Build the serialized /debug/routes payload on first use and reuse it afterwards"""
+        nonlocal routes_cache
+        if routes_cache is None:
+            routes = []
+            for route in app.routes:
+                if hasattr(route, 'path') and hasattr(route, 'methods'):
+                    routes.append({
+                        "path": route.path,
+                        "methods": list(route.methods),
+                        "name": route.name if hasattr(route, 'name') else None
+                    })
+            routes_cache = _dumps({
+                "total_routes": len(routes),
+                "routes": sorted(routes, key=lambda x: x['path']),
+                **extra
+            })
+        return routes_cache
+    
+    @app.get("/debug/routes")
+    async def debug_routes():
+        """Debug endpoint to list all registered routes"""
+        return Response(content=get_routes_listing(), media_type="application/json")
+    
+    @app.on_event("startup")
+    async def startup_event():
+        """Log when the application starts"""
+        print("\n" + "="*50)
+        print(config["ready_banner"])
+        print("="*50)
+        
+        if vercel:
+            log_info(f"Backend starting up in Vercel mode - PID: {os.getpid()}", "main.startup")
+        else:
+            log_info(f"Backend starting up - PID: {os.getpid()}", "main.startup")
+            log_info(f"Running with timeout_keep_alive=0, no worker recycling", "main.startup")
+        
+        # Routers are all registered by now, so build the /debug/routes payload once
+        get_routes_listing()
+        
+        # Check element registry initialization
+        try:
+            from core.calculators.element_types import element_registry
+            print(f"\n✓ Element registry initialized with {len(element_registry._types)} types")
+            log_info(f"Element registry initialized with {len(element_registry._types)} types", "main.startup")
+            
+            # List all registered routes
+            print("\n✓ Registered API routes:")
+            for route in app.routes:
+                if hasattr(route, 'path') and hasattr(route, 'methods'):
+                    if route.path.startswith('/api'):
+                        methods = ', '.join(route.methods)
+                        print(f"  - {methods} {route.path}")
+            
+            if vercel:
+                print("\n✓ Vercel deployment ready")
+            else:
+                # Health monitor (a 5s uptime print loop) stays disabled while
+                # testing whether it contributed to idle crashes
+                print("\n✓ Health monitor disabled for testing")
+        
+        except Exception as e:
+            print(f"\n✗ ERROR in startup: {e}")
+            traceback.print_exc()
+        
+        if not vercel:
+            _register_signal_handlers()
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Log when the application shuts down"""
+        log_info("Backend shutdown event triggered (Vercel)" if vercel else "Backend shutdown event triggered", "main.shutdown")
+        log_info(f"Process {os.getpid()} ending", "main.shutdown")
+    
+    return app
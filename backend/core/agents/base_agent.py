@@ -31,7 +31,7 @@ class AgentMessage:
     timestamp: datetime = field(default_factory=datetime.now)
     correlation_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapability:
     name: str
     description: str
@@ -1,11 +1,89 @@
 import asyncio
+import copy
+import itertools
 import logging
+from collections import defaultdict
 from typing import Dict, Any, List
+from dataclasses import dataclass
 from datetime import datetime
 
 from ..base_agent import BaseAgent, AgentCapability
+from ...calculators.base_calculator import OptimizationUtilities, StandardLengthsRegistry
 from ...calculators.joist_calculator import JoistCalculator, JoistCalculationResult
 
+# Default agent IDs share one start-up timestamp and a per-process sequence,
+# so agents created within the same second no longer collide
+_AGENT_STAMP = datetime.now().strftime('%Y%m%d_%H%M%S')
+_AGENT_SEQ = itertools.count(1)
+
+# Simplified pricing, carbon and load tables (would integrate with real data sources)
+_MATERIAL_PRICES = {
+    "LVL": 15.50,  # per linear meter
+    "Treated Pine": 8.25,  # per linear meter
+    "Steel": 22.00  # per linear meter
+}
+
+_CARBON_FACTORS = {
+    "LVL": 0.45,  # kg CO2 per linear meter
+    "Treated Pine": 0.25,  # kg CO2 per linear meter
+    "Steel": 1.20  # kg CO2 per linear meter
+}
+
+_LIVE_LOAD = {"residential": 1.5, "commercial": 2.5}  # kN/m²
+_TOTAL_LOAD = {"residential": 2.1, "commercial": 3.1}  # kN/m²
+
+_ECO_RECOMMENDATIONS = (
+    "Consider using certified sustainable timber",
+    "Optimize cuts to reduce waste",
+    "Plan efficient delivery routes"
+)
+
+# Enhancement sections and the methods that compute them, in output order
+_ENHANCEMENT_SECTIONS = {
+    "material_efficiency": "_calculate_material_efficiency",
+    "cost_estimation": "_estimate_costs",
+    "delivery_optimization": "_optimize_delivery",
+    "environmental_impact": "_calculate_environmental_impact"
+}
+
+# Enhancement sections for a result with no cutting list (e.g. load-only queries)
+_EMPTY_ENHANCEMENT = {
+    "material_efficiency": {
+        "total_required_length": 0,
+        "total_purchased_length": 0,
+        "waste_percentage": 0.0,
+        "efficiency_score": 100.0,
+        "optimization_potential": "low"
+    },
+    "cost_estimation": {
+        "total_cost": 0.0,
+        "cost_breakdown": {},
+        "cost_per_square_meter": 0.0,
+        "currency": "AUD"
+    },
+    "delivery_optimization": {
+        "material_groups": 0,
+        "delivery_suggestions": [],
+        "estimated_delivery_days": 0,
+        "consolidation_opportunities": False
+    },
+    "environmental_impact": {
+        "carbon_footprint_kg": 0.0,
+        "sustainability_rating": "A",
+        "eco_recommendations": list(_ECO_RECOMMENDATIONS)
+    }
+}
+
+@dataclass(slots=True, frozen=True)
+class JoistCalculationContext:
+    """Scalar inputs shared by the recommendation, warning and optimization checks"""
+    span_length: float
+    spacing: float
+    load_type: str
+    material_spec: str
+    joist_count: int
+    cutting_list: List[Dict[str, Any]]
+
 class JoistCalculationAgent(BaseAgent):
     """
     Specialized agent for joist calculation tasks.
@@ -39,7 +117,7 @@ class JoistCalculationAgent(BaseAgent):
         ]
         
         super().__init__(
-            agent_id=agent_id or f"joist_calc_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            agent_id=agent_id or f"joist_calc_{_AGENT_STAMP}_{next(_AGENT_SEQ)}",
             name=name or "Joist Calculation Agent",
             capabilities=capabilities
         )
@@ -112,33 +190,53 @@ class JoistCalculationAgent(BaseAgent):
         
         self.calculations_completed += 1
         
+        # Extract the shared inputs once for the recommendation checks
+        ctx = JoistCalculationContext(
+            span_length=span_length,
+            spacing=joist_spacing,
+            load_type=load_type,
+            material_spec=result.get("material_specification", ""),
+            joist_count=result.get("joist_count", 0),
+            cutting_list=result.get("cutting_list", [])
+        )
+        
         return {
             "status": "completed",
             "calculation_result": enhanced_result,
-            "ai_recommendations": await self._generate_ai_recommendations(result, task_data),
-            "warnings": await self._check_safety_warnings(result, task_data),
-            "optimization_suggestions": await self._suggest_optimizations(result, task_data),
+            "ai_recommendations": await self._generate_ai_recommendations(ctx),
+            "warnings": await self._check_safety_warnings(ctx),
+            "optimization_suggestions": await self._suggest_optimizations(ctx),
             "calculation_notes": result.get("calculation_notes", []),
             "assumptions": result.get("assumptions", [])
         }
     
     async def _enhance_calculation_result(self, result: Dict[str, Any], task_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Enhance the basic calculation result with additional insights"""
-        enhanced = result.copy()
-        
-        # Add material efficiency metrics
-        enhanced["material_efficiency"] = await self._calculate_material_efficiency(result)
-        
-        # Add cost estimation
-        enhanced["cost_estimation"] = await self._estimate_costs(result)
+        """Enhance the basic calculation result in place with additional insights"""
+        # Callers may request a subset of sections (a list of names, or one name);
+        # all are computed by default
+        sections = task_data.get("enhancements")
+        if not sections:
+            sections = _ENHANCEMENT_SECTIONS
+        elif isinstance(sections, str):
+            sections = (sections,)
+        elif not isinstance(sections, (list, tuple)):
+            raise ValueError(
+                f"enhancements must be a section name or a list of section names, got {type(sections).__name__}"
+            )
+        for section in sections:
+            if section not in _ENHANCEMENT_SECTIONS:
+                raise ValueError(f"Unknown enhancement section: {section}")
         
-        # Add delivery optimization
-        enhanced["delivery_optimization"] = await self._optimize_delivery(result)
+        if not result.get("cutting_list"):
+            for section in sections:
+                result[section] = copy.deepcopy(_EMPTY_ENHANCEMENT[section])
+            return result
         
-        # Add environmental impact
-        enhanced["environmental_impact"] = await self._calculate_environmental_impact(result)
+        for section in sections:
+            compute = getattr(self, _ENHANCEMENT_SECTIONS[section])
+            result[section] = await compute(result)
         
-        return enhanced
+        return result
     
     async def _calculate_material_efficiency(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate material efficiency metrics"""
@@ -146,8 +244,11 @@ class JoistCalculationAgent(BaseAgent):
         await asyncio.sleep(0.1)  # Simulate processing time
         
         cutting_list = result.get("cutting_list", [])
-        total_required = sum(item.get("total_length", 0) for item in cutting_list)
-        total_purchased = sum(item.get("purchased_length", 0) for item in cutting_list)
+        total_required = 0
+        total_purchased = 0
+        for item in cutting_list:
+            total_required += item.get("total_length", 0)
+            total_purchased += item.get("purchased_length", 0)
         
         waste_percentage = 0.0
         if total_purchased > 0:
@@ -169,25 +270,19 @@ class JoistCalculationAgent(BaseAgent):
         cutting_list = result.get("cutting_list", [])
         total_cost = 0.0
         
-        material_prices = {
-            "LVL": 15.50,  # per linear meter
-            "Treated Pine": 8.25,  # per linear meter
-            "Steel": 22.00  # per linear meter
-        }
-        
-        cost_breakdown = {}
+        cost_breakdown = defaultdict(float)
         for item in cutting_list:
             material_type = item.get("material_type", "Treated Pine")
             length = item.get("total_length", 0)
-            unit_price = material_prices.get(material_type, 10.0)
+            unit_price = _MATERIAL_PRICES.get(material_type, 10.0)
             item_cost = length * unit_price
             
             total_cost += item_cost
-            cost_breakdown[material_type] = cost_breakdown.get(material_type, 0) + item_cost
+            cost_breakdown[material_type] += item_cost
         
         return {
             "total_cost": round(total_cost, 2),
-            "cost_breakdown": cost_breakdown,
+            "cost_breakdown": dict(cost_breakdown),
             "cost_per_square_meter": round(total_cost / max(1, result.get("span_area", 1)), 2),
             "currency": "AUD"
         }
@@ -199,12 +294,9 @@ class JoistCalculationAgent(BaseAgent):
         cutting_list = result.get("cutting_list", [])
         
         # Group by material type and supplier
-        material_groups = {}
+        material_groups = defaultdict(list)
         for item in cutting_list:
-            material_type = item.get("material_type", "Unknown")
-            if material_type not in material_groups:
-                material_groups[material_type] = []
-            material_groups[material_type].append(item)
+            material_groups[item.get("material_type", "Unknown")].append(item)
         
         # Suggest delivery optimization
         delivery_suggestions = []
@@ -228,30 +320,20 @@ class JoistCalculationAgent(BaseAgent):
         cutting_list = result.get("cutting_list", [])
         
         # Simplified carbon footprint calculation
-        carbon_factors = {
-            "LVL": 0.45,  # kg CO2 per linear meter
-            "Treated Pine": 0.25,  # kg CO2 per linear meter
-            "Steel": 1.20  # kg CO2 per linear meter
-        }
-        
         total_carbon = 0.0
         for item in cutting_list:
             material_type = item.get("material_type", "Treated Pine")
             length = item.get("total_length", 0)
-            carbon_factor = carbon_factors.get(material_type, 0.35)
+            carbon_factor = _CARBON_FACTORS.get(material_type, 0.35)
             total_carbon += length * carbon_factor
         
         return {
             "carbon_footprint_kg": round(total_carbon, 2),
             "sustainability_rating": "A" if total_carbon < 50 else "B" if total_carbon < 100 else "C",
-            "eco_recommendations": [
-                "Consider using certified sustainable timber",
-                "Optimize cuts to reduce waste",
-                "Plan efficient delivery routes"
-            ]
+            "eco_recommendations": list(_ECO_RECOMMENDATIONS)
         }
     
-    async def _generate_ai_recommendations(self, result: Dict[str, Any], task_data: Dict[str, Any]) -> List[str]:
+    async def _generate_ai_recommendations(self, ctx: JoistCalculationContext) -> List[str]:
         """Generate AI-powered recommendations"""
         if not self.ai_recommendations:
             return []
@@ -259,30 +341,29 @@ class JoistCalculationAgent(BaseAgent):
         recommendations = []
         
         # Check joist spacing optimization
-        spacing = task_data.get("joist_spacing", 0.45)
-        if spacing == 0.45:
+        if ctx.spacing == 0.45:
             recommendations.append("Consider 600mm spacing if load permits - reduces material by 25%")
         
         # Check material selection
-        span_length = task_data.get("span_length", 0)
-        if span_length > 4.5:
+        if ctx.span_length > 4.5:
             recommendations.append("LVL material recommended for spans over 4.5m for better performance")
         
         # Check blocking optimization
-        joist_count = result.get("joist_count", 0)
-        if joist_count > 8:
+        if ctx.joist_count > 8:
             recommendations.append("Consider additional blocking rows for improved stability")
         
         # Check waste reduction
-        cutting_list = result.get("cutting_list", [])
+        cutting_list = ctx.cutting_list
         if cutting_list:
-            total_waste = sum(item.get("waste", 0) for item in cutting_list)
+            total_waste = 0
+            for item in cutting_list:
+                total_waste += item.get("waste", 0)
             if total_waste > 15:
                 recommendations.append("High waste detected - consider custom lengths or different layout")
         
         return recommendations
     
-    async def _check_safety_warnings(self, result: Dict[str, Any], task_data: Dict[str, Any]) -> List[str]:
+    async def _check_safety_warnings(self, ctx: JoistCalculationContext) -> List[str]:
         """Check for safety concerns and generate warnings"""
         if not self.safety_factor_warnings:
             return []
@@ -290,46 +371,38 @@ class JoistCalculationAgent(BaseAgent):
         warnings = []
         
         # Check span limits
-        span_length = task_data.get("span_length", 0)
-        material_spec = result.get("material_specification", "")
-        
-        if span_length > 6.0 and "90x45" in material_spec:
+        if ctx.span_length > 6.0 and "90x45" in ctx.material_spec:
             warnings.append("WARNING: Span exceeds recommended limit for 90x45 material")
             self.warnings_generated += 1
         
         # Check spacing limits
-        spacing = task_data.get("joist_spacing", 0.45)
-        if spacing > 0.6:
+        if ctx.spacing > 0.6:
             warnings.append("WARNING: Joist spacing exceeds standard maximum of 600mm")
             self.warnings_generated += 1
         
         # Check load considerations
-        load_type = task_data.get("load_type", "residential")
-        if load_type == "commercial" and span_length > 4.0:
+        if ctx.load_type == "commercial" and ctx.span_length > 4.0:
             warnings.append("CAUTION: Commercial loads require engineering verification")
             self.warnings_generated += 1
         
         return warnings
     
-    async def _suggest_optimizations(self, result: Dict[str, Any], task_data: Dict[str, Any]) -> List[str]:
+    async def _suggest_optimizations(self, ctx: JoistCalculationContext) -> List[str]:
         """Suggest optimization opportunities"""
         if not self.optimization_enabled:
             return []
         
-        suggestions = []
-        
-        # Material optimization
-        cutting_list = result.get("cutting_list", [])
-        for item in cutting_list:
-            waste = item.get("waste", 0)
-            if waste > 0.5:  # 500mm or more waste
-                suggestions.append(f"Optimize {item.get('description', 'material')} cutting to reduce {waste}m waste")
+        # Material optimization - flag items with 500mm or more waste
+        suggestions = [
+            f"Optimize {item.get('description', 'material')} cutting to reduce {waste}m waste"
+            for item in ctx.cutting_list
+            if (waste := item.get("waste", 0)) > 0.5
+        ]
         
         # Layout optimization
-        joist_count = result.get("joist_count", 0)
-        span_length = task_data.get("span_length", 0)
-        if joist_count * 0.45 < span_length:
-            savings = span_length - (joist_count * 0.45)
+        layout_length = ctx.joist_count * 0.45
+        if layout_length < ctx.span_length:
+            savings = ctx.span_length - layout_length
             suggestions.append(f"Layout optimization could save {savings:.2f}m of material")
             self.optimization_savings += savings
         
@@ -339,17 +412,54 @@ class JoistCalculationAgent(BaseAgent):
         """Optimize joist layout for multiple spans or complex geometries"""
         self.logger.info("Performing joist layout optimization")
         
-        # This would implement advanced optimization algorithms
-        # For now, return a simplified optimization result
-        
         spans = task_data.get("spans", [])
         constraints = task_data.get("constraints", {})
         
+        # Pool identical piece lengths across spans so they can share stock lengths,
+        # then run one standard-length search per distinct piece length
+        pieces_by_length = defaultdict(int)
+        for span in spans:
+            piece_length = span.get("piece_length")
+            if not piece_length:
+                raise ValueError("Each span requires a piece_length")
+            pieces_by_length[piece_length] += span.get("num_pieces", 1)
+        
+        cutting_plan = []
+        total_required = 0.0
+        total_ordered = 0.0
+        unpooled_ordered = 0.0
+        for piece_length, num_pieces in sorted(pieces_by_length.items()):
+            single_length = StandardLengthsRegistry.get_optimal_length(piece_length)
+            option = OptimizationUtilities.optimize_short_lengths(
+                num_pieces, piece_length, StandardLengthsRegistry.TIMBER_LENGTHS
+            )
+            if option:
+                standard_length = option["standard_length"]
+                lengths_ordered = option["pieces_needed"]
+            else:
+                standard_length = single_length
+                lengths_ordered = num_pieces
+            
+            cutting_plan.append({
+                "piece_length": piece_length,
+                "num_pieces": num_pieces,
+                "standard_length": standard_length,
+                "lengths_ordered": lengths_ordered
+            })
+            total_required += num_pieces * piece_length
+            total_ordered += lengths_ordered * standard_length
+            unpooled_ordered += num_pieces * single_length
+        
+        # Savings are measured against ordering one standard length per piece
+        saved_length = unpooled_ordered - total_ordered
+        unit_price = _MATERIAL_PRICES.get(constraints.get("material_type", "Treated Pine"), 10.0)
+        
         optimization_result = {
             "optimized_spans": len(spans),
-            "material_savings": 15.5,  # percentage
-            "cost_savings": 234.50,  # AUD
-            "layout_efficiency": 92.3,  # percentage
+            "material_savings": round(saved_length / unpooled_ordered * 100, 1) if unpooled_ordered else 0.0,  # percentage
+            "cost_savings": round(saved_length * unit_price, 2),  # AUD
+            "layout_efficiency": round(total_required / total_ordered * 100, 1) if total_ordered else 0.0,  # percentage
+            "cutting_plan": cutting_plan,
             "recommendations": [
                 "Align joist layouts across floors to reduce cutting",
                 "Use standard lengths where possible",
@@ -373,8 +483,8 @@ class JoistCalculationAgent(BaseAgent):
         # Simplified load calculation (would integrate with structural analysis)
         load_calculations = {
             "dead_load": 0.6,  # kN/m²
-            "live_load": 1.5 if load_type == "residential" else 2.5,  # kN/m²
-            "total_load": 2.1 if load_type == "residential" else 3.1,
+            "live_load": _LIVE_LOAD.get(load_type, _LIVE_LOAD["commercial"]),  # kN/m²
+            "total_load": _TOTAL_LOAD.get(load_type, _TOTAL_LOAD["commercial"]),
             "required_moment_capacity": span_length ** 2 * 0.125,
             "recommended_material": "200x45 LVL" if span_length > 4.0 else "90x45 H2 MGP10",
             "safety_factor": 2.5
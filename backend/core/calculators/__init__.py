@@ -15,11 +15,11 @@ from .base_calculator import (
 )
 
 # Element type system
+from . import element_types
 from .element_types import (
     CalculatorType,
     ElementSpecification,
     ElementTypeRegistry,
-    element_registry,
     get_element_type,
     get_all_element_types
 )
@@ -56,4 +56,11 @@ __all__ = [
     # Factory
     'CalculatorFactory',
     'create_calculator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # element_registry is created lazily by element_types on first access
+    if name == 'element_registry':
+        return element_types.element_registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
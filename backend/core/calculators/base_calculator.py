@@ -16,9 +16,12 @@ ARCHITECTURAL PRINCIPLES:
 """
 
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import math
 
 
@@ -84,6 +87,86 @@ class ConstructionCalculator(ABC):
                 raise ValueError(f"{key} must be a positive number")
 
 
+def ceil_div_mm(value: float, step: float) -> int:
+    """
+    Return ``ceil(value / step)`` computed on whole millimetres.
+    
+    Rounding both lengths to millimetres first drops float noise, so an exact
+    multiple such as 2.1m at 0.3m centres gives 7 rather than 8.
+    
+    Args:
+        value: Length to divide, in meters
+        step: Spacing or piece length, in meters
+    
+    Returns:
+        Number of steps needed to cover ``value``
+    
+    Raises:
+        ValueError: If ``step`` is under half a millimetre, so it rounds to 0mm
+    """
+    step_mm = round(step * 1000)
+    if step_mm <= 0:
+        raise ValueError(f"Spacing must be at least 1mm, got {step}m")
+    return -(-round(value * 1000) // step_mm)
+
+
+@lru_cache(maxsize=1024)
+def round_up_to_standard_length(required_length: float, lengths: Tuple[float, ...]) -> float:
+    """
+    Return the shortest length in ``lengths`` that is at least ``required_length``.
+    
+    Results are memoized, so ``lengths`` must be a tuple, and it must be sorted
+    ascending for the binary search.
+    
+    Args:
+        required_length: The minimum length needed
+        lengths: Sorted standard lengths to choose from
+    
+    Returns:
+        The shortest fitting standard length, or the requirement rounded up to
+        the nearest 0.6m if none is long enough
+    """
+    i = bisect_left(lengths, required_length)
+    if i < len(lengths):
+        return lengths[i]
+    
+    # If no standard length is long enough, round up to nearest 0.6m
+    return math.ceil(required_length / 0.6) * 0.6
+
+
+@lru_cache(maxsize=1024)
+def _pick_short_length_stock(
+    num_pieces: int,
+    piece_length: float,
+    standard_lengths: Tuple[float, ...],
+    max_waste_percent: float
+) -> Optional[Tuple[float, int, int, float]]:
+    """
+    Find the standard length that cuts ``num_pieces`` short pieces with the least waste.
+    
+    Returns:
+        Tuple of (standard length, pieces per length, lengths needed, waste
+        percent), or None if no length stays under ``max_waste_percent``
+    """
+    total_length_needed = num_pieces * piece_length
+    best = None
+    min_waste_percent = max_waste_percent
+    
+    for std_length in standard_lengths:
+        pieces_per_standard = int(std_length / piece_length)
+        if pieces_per_standard >= 2:
+            standards_needed = -(-num_pieces // pieces_per_standard)
+            total_length_ordered = standards_needed * std_length
+            waste = total_length_ordered - total_length_needed
+            waste_percent = (waste / total_length_ordered) * 100
+            
+            if waste_percent < min_waste_percent:
+                min_waste_percent = waste_percent
+                best = (std_length, pieces_per_standard, standards_needed, waste_percent)
+    
+    return best
+
+
 class StandardLengthsRegistry:
     """
     Central registry for standard material lengths used across all calculators.
@@ -102,6 +185,10 @@ class StandardLengthsRegistry:
     # Sheet material sizes (width, height)
     SHEET_SIZES = [(2.4, 1.2), (2.7, 1.2), (3.0, 1.2)]
     
+    # Sorted, hashable copies used as memoization keys by get_optimal_length
+    _SORTED_TIMBER = tuple(sorted(TIMBER_LENGTHS))
+    _SORTED_STEEL = tuple(sorted(STEEL_LENGTHS))
+    
     @classmethod
     def get_optimal_length(cls, required_length: float, material_type: str = 'timber') -> float:
         """
@@ -114,19 +201,12 @@ class StandardLengthsRegistry:
         Returns:
             The shortest standard length that meets the requirement
         """
-        if material_type == 'timber':
-            lengths = cls.TIMBER_LENGTHS
-        elif material_type == 'steel':
-            lengths = cls.STEEL_LENGTHS
+        if material_type == 'steel':
+            lengths = cls._SORTED_STEEL
         else:
-            lengths = cls.TIMBER_LENGTHS  # Default to timber
+            lengths = cls._SORTED_TIMBER  # Default to timber
         
-        for standard_length in sorted(lengths):
-            if standard_length >= required_length:
-                return standard_length
-        
-        # If no standard length is long enough, round up to nearest 0.6m
-        return math.ceil(required_length / 0.6) * 0.6
+        return round_up_to_standard_length(required_length, lengths)
 
 
 class OptimizationUtilities:
@@ -156,34 +236,31 @@ class OptimizationUtilities:
         if piece_length >= min(standard_lengths):
             return None
         
-        total_length_needed = num_pieces * piece_length
-        best_option = None
-        min_waste_percent = float('inf')
+        # Nothing to cut up if even the longest length can't hold two pieces
+        if int(max(standard_lengths) / piece_length) < 2:
+            return None
         
-        for std_length in standard_lengths:
-            pieces_per_standard = int(std_length / piece_length)
-            if pieces_per_standard >= 2:
-                standards_needed = math.ceil(num_pieces / pieces_per_standard)
-                total_length_ordered = standards_needed * std_length
-                waste = total_length_ordered - total_length_needed
-                waste_percent = (waste / total_length_ordered) * 100
-                
-                if waste_percent < min_waste_percent and waste_percent < max_waste_percent:
-                    min_waste_percent = waste_percent
-                    best_option = {
-                        'optimized': True,
-                        'pieces_needed': standards_needed,
-                        'standard_length': std_length,
-                        'pieces_per_length': pieces_per_standard,
-                        'waste_percent': waste_percent,
-                        'calculation': (
-                            f"{piece_length}m x {num_pieces} = {total_length_needed:.2f}m / "
-                            f"{standards_needed} Lengths = {total_length_needed/standards_needed:.3f}m "
-                            f"=> {std_length}m (cut up)"
-                        )
-                    }
+        # The search is memoized; only the result dict is built per call
+        best = _pick_short_length_stock(
+            num_pieces, piece_length, tuple(standard_lengths), max_waste_percent
+        )
+        if best is None:
+            return None
         
-        return best_option
+        std_length, pieces_per_standard, standards_needed, min_waste_percent = best
+        total_length_needed = num_pieces * piece_length
+        return {
+            'optimized': True,
+            'pieces_needed': standards_needed,
+            'standard_length': std_length,
+            'pieces_per_length': pieces_per_standard,
+            'waste_percent': min_waste_percent,
+            'calculation': (
+                f"{piece_length}m x {num_pieces} = {total_length_needed:.2f}m / "
+                f"{standards_needed} Lengths = {total_length_needed/standards_needed:.3f}m "
+                f"=> {std_length}m (cut up)"
+            )
+        }
     
     @staticmethod
     def optimize_total_length(
@@ -271,19 +348,16 @@ class CalculationFormatter:
         Returns:
             List of formatted lines
         """
-        lines = [material_spec + ":"]
-        
         # Group by length
-        length_groups = {}
+        length_groups = Counter()
         for item in items:
-            length = item['length']
-            if length not in length_groups:
-                length_groups[length] = 0
-            length_groups[length] += item['quantity']
+            length_groups[item['length']] += item['quantity']
         
         # Format each length group
-        for length in sorted(length_groups.keys()):
-            quantity = length_groups[length]
-            lines.append(f"  {quantity} Lengths @ {length:.1f}m")
+        lines = [material_spec + ":"]
+        lines.extend(
+            f"  {length_groups[length]} Lengths @ {length:.1f}m"
+            for length in sorted(length_groups)
+        )
         
         return lines
\ No newline at end of file
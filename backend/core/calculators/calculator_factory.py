@@ -7,16 +7,25 @@ based on element types. It provides a centralized way to instantiate the
 appropriate calculator for any given element type.
 """
 
-from typing import Dict, Type, Optional, Any
+from typing import Dict, Type, Optional, Any, Tuple, Set
 from enum import Enum
 import importlib
+import logging
+import os
+import sys
 
+from . import element_types
 from .base_calculator import ConstructionCalculator
-from .element_types import (
-    CalculatorType,
-    ElementSpecification,
-    element_registry
-)
+from .element_types import CalculatorType, ElementSpecification
+
+
+logger = logging.getLogger(__name__)
+
+# Display labels for each calculator type, e.g. 'wall_frame' -> 'Wall Frame'
+_CALC_TYPE_LABELS: Dict[CalculatorType, str] = {
+    calc_type: calc_type.value.replace('_', ' ').title()
+    for calc_type in CalculatorType
+}
 
 
 class CalculatorFactory:
@@ -34,19 +43,39 @@ class CalculatorFactory:
     # Registry of available calculator classes
     _calculator_classes: Dict[CalculatorType, Type[ConstructionCalculator]] = {}
     
-    # Registry of calculator module paths for lazy loading
-    _calculator_modules: Dict[CalculatorType, str] = {
-        CalculatorType.JOIST: "core.calculators.enhanced_joist_calculator.EnhancedJoistCalculator",
-        CalculatorType.GENERIC: "core.calculators.generic_calculator.GenericCalculator",
-        CalculatorType.WALL_FRAME: "core.calculators.generic_calculator.GenericCalculator",
-        CalculatorType.BEARER: "core.calculators.generic_calculator.GenericCalculator",
-        CalculatorType.RAFTER: "core.calculators.generic_calculator.GenericCalculator",
-        CalculatorType.COLUMN: "core.calculators.generic_calculator.GenericCalculator",
+    # Calculator types whose module failed to load; not retried until re-registered
+    _failed_types: Set[CalculatorType] = set()
+    
+    # Registry of calculator (module, class name) pairs for lazy loading
+    _calculator_modules: Dict[CalculatorType, Tuple[str, str]] = {
+        CalculatorType.JOIST: ("core.calculators.enhanced_joist_calculator", "EnhancedJoistCalculator"),
+        CalculatorType.GENERIC: ("core.calculators.generic_calculator", "GenericCalculator"),
+        CalculatorType.WALL_FRAME: ("core.calculators.generic_calculator", "GenericCalculator"),
+        CalculatorType.BEARER: ("core.calculators.generic_calculator", "GenericCalculator"),
+        CalculatorType.RAFTER: ("core.calculators.generic_calculator", "GenericCalculator"),
+        CalculatorType.COLUMN: ("core.calculators.generic_calculator", "GenericCalculator"),
     }
     
     # Singleton instances for stateful calculators
     _singleton_instances: Dict[CalculatorType, ConstructionCalculator] = {}
     
+    # Resolved (calculator type, class, element spec) per element code; cleared
+    # whenever the element registry or the calculator registrations change
+    _by_element_code: Dict[str, Tuple[CalculatorType, Type[ConstructionCalculator], ElementSpecification]] = {}
+    _registry_hooked = False
+    
+    # Whether each calculator class supports configure_for_element
+    _configurable_cache: Dict[type, bool] = {}
+    
+    @classmethod
+    def _is_configurable(cls, calculator_class: type) -> bool:
+        """Check once per class whether it provides configure_for_element."""
+        configurable = cls._configurable_cache.get(calculator_class)
+        if configurable is None:
+            configurable = hasattr(calculator_class, 'configure_for_element')
+            cls._configurable_cache[calculator_class] = configurable
+        return configurable
+    
     @classmethod
     def _load_calculator_class(cls, calculator_type: CalculatorType) -> Optional[Type[ConstructionCalculator]]:
         """
@@ -59,19 +88,19 @@ class CalculatorFactory:
             The calculator class or None if not found
         """
         # Check if already loaded
-        if calculator_type in cls._calculator_classes:
-            return cls._calculator_classes[calculator_type]
+        calculator_class = cls._calculator_classes.get(calculator_type)
+        if calculator_class is not None:
+            return calculator_class
         
-        # Check if we have a module path for this type
-        if calculator_type not in cls._calculator_modules:
+        # Check if we have a module path for this type and it hasn't already failed
+        if calculator_type not in cls._calculator_modules or calculator_type in cls._failed_types:
             return None
         
         try:
-            module_path = cls._calculator_modules[calculator_type]
-            module_name, class_name = module_path.rsplit('.', 1)
+            module_name, class_name = cls._calculator_modules[calculator_type]
             
-            # Import the module
-            module = importlib.import_module(module_name)
+            # Import the module, skipping the import machinery if already loaded
+            module = sys.modules.get(module_name) or importlib.import_module(module_name)
             
             # Get the class from the module
             calculator_class = getattr(module, class_name)
@@ -82,7 +111,8 @@ class CalculatorFactory:
             return calculator_class
             
         except (ImportError, AttributeError) as e:
-            print(f"Failed to load calculator for {calculator_type}: {e}")
+            logger.warning(f"Failed to load calculator for {calculator_type}: {e}")
+            cls._failed_types.add(calculator_type)
             return None
     
     @classmethod
@@ -101,6 +131,8 @@ class CalculatorFactory:
             use_singleton: If True, only one instance will be created and reused
         """
         cls._calculator_classes[calculator_type] = calculator_class
+        cls._failed_types.discard(calculator_type)
+        cls._by_element_code.clear()
         
         # Remove singleton if switching away from singleton mode
         if not use_singleton and calculator_type in cls._singleton_instances:
@@ -117,28 +149,39 @@ class CalculatorFactory:
         Returns:
             Calculator instance or None if element not found
         """
-        # Get element specification from registry
-        element_spec = element_registry.get(element_code)
-        if not element_spec or not element_spec.active:
-            return None
+        resolved = cls._by_element_code.get(element_code)
+        if resolved is None:
+            registry = element_types.element_registry
+            if not cls._registry_hooked:
+                registry.add_change_listener(cls._by_element_code.clear)
+                cls._registry_hooked = True
+            
+            # Get element specification from registry
+            element_spec = registry.get(element_code)
+            if not element_spec or not element_spec.active:
+                return None
+            
+            resolved = cls._resolve_class(element_spec.calculator_type)
+            if resolved is None:
+                return None
+            resolved = (*resolved, element_spec)
+            cls._by_element_code[element_code] = resolved
         
-        return cls.create_from_type(element_spec.calculator_type, element_spec)
+        return cls._instantiate(*resolved)
     
     @classmethod
-    def create_from_type(
+    def _resolve_class(
         cls,
-        calculator_type: CalculatorType,
-        element_spec: Optional[ElementSpecification] = None
-    ) -> Optional[ConstructionCalculator]:
+        calculator_type: CalculatorType
+    ) -> Optional[Tuple[CalculatorType, Type[ConstructionCalculator]]]:
         """
-        Create a calculator instance for a specific calculator type.
+        Resolve the calculator type and class to use, falling back to generic.
         
         Args:
-            calculator_type: Type of calculator to create
-            element_spec: Optional element specification for configuration
+            calculator_type: Requested calculator type
         
         Returns:
-            Calculator instance or None if type not registered
+            (calculator type, calculator class) or None if nothing can be loaded
         """
         # Try to load the calculator class lazily
         calculator_class = cls._load_calculator_class(calculator_type)
@@ -150,12 +193,54 @@ class CalculatorFactory:
                 return None
             calculator_type = CalculatorType.GENERIC
         
+        return calculator_type, calculator_class
+    
+    @classmethod
+    def create_from_type(
+        cls,
+        calculator_type: CalculatorType,
+        element_spec: Optional[ElementSpecification] = None
+    ) -> Optional[ConstructionCalculator]:
+        """
+        Create a calculator instance for a specific calculator type.
+        
+        Args:
+            calculator_type: Type of calculator to create
+            element_spec: Optional element specification for configuration
+        
+        Returns:
+            Calculator instance or None if type not registered
+        """
+        resolved = cls._resolve_class(calculator_type)
+        if resolved is None:
+            return None
+        
+        return cls._instantiate(*resolved, element_spec)
+    
+    @classmethod
+    def _instantiate(
+        cls,
+        calculator_type: CalculatorType,
+        calculator_class: Type[ConstructionCalculator],
+        element_spec: Optional[ElementSpecification]
+    ) -> ConstructionCalculator:
+        """
+        Return a calculator of a resolved type, configured for the element if given.
+        
+        Args:
+            calculator_type: Resolved calculator type
+            calculator_class: Calculator class for that type
+            element_spec: Optional element specification for configuration
+        
+        Returns:
+            Calculator instance
+        """
         # Check if we should use a singleton instance
         if calculator_type in cls._singleton_instances:
             calculator = cls._singleton_instances[calculator_type]
             
             # Configure for specific element if needed
-            if element_spec and hasattr(calculator, 'configure_for_element'):
+            if element_spec and cls._is_configurable(type(calculator)):
                 calculator.configure_for_element(element_spec)
             
             return calculator
@@ -169,7 +254,7 @@ class CalculatorFactory:
             calculator = calculator_class()
         
         # Configure with element spec if method exists
-        if element_spec and hasattr(calculator, 'configure_for_element'):
+        if element_spec and cls._is_configurable(calculator_class):
             calculator.configure_for_element(element_spec)
         
         return calculator
@@ -182,10 +267,10 @@ class CalculatorFactory:
         Returns:
             Dictionary mapping calculator type names to descriptions
         """
-        available = {}
-        for calc_type in cls._calculator_classes.keys():
-            available[calc_type.value] = calc_type.value.replace('_', ' ').title()
-        return available
+        return {
+            calc_type.value: _CALC_TYPE_LABELS[calc_type]
+            for calc_type in cls._calculator_classes
+        }
     
     @classmethod
     def create_generic_calculator(cls) -> Optional[ConstructionCalculator]:
@@ -201,11 +286,18 @@ class CalculatorFactory:
     def clear_singletons(cls) -> None:
         """Clear all singleton instances."""
         cls._singleton_instances.clear()
+        cls._by_element_code.clear()
 
 
 # Note: Calculator registration is now handled lazily through _calculator_modules
 # This prevents heavy imports at startup and improves performance
 
+# The generic calculator is the fallback for every unimplemented element type,
+# so load it up front unless disabled; the first request then skips the import
+EAGER_GENERIC_CALCULATOR = os.getenv("EAGER_GENERIC_CALCULATOR", "true").lower() == "true"
+if EAGER_GENERIC_CALCULATOR:
+    CalculatorFactory._load_calculator_class(CalculatorType.GENERIC)
+
 
 def create_calculator(element_code: str) -> Optional[ConstructionCalculator]:
     """
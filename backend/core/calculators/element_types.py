@@ -10,13 +10,21 @@ The registry serves as the single source of truth for all element specifications
 and their associated calculators.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Mapping, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-import json
+from functools import lru_cache
+from types import MappingProxyType
+import sys
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class CalculatorType(Enum):
+
+class CalculatorType(str, Enum):
     """Available calculator types in the system."""
     JOIST = "joist"
     WALL_FRAME = "wall_frame"
@@ -26,24 +34,66 @@ class CalculatorType(Enum):
     GENERIC = "generic"  # Fallback for unknown types
 
 
-@dataclass
+# Specification fields each calculator type requires, with the label used in errors
+_REQUIRED_SPEC_FIELDS: Dict[CalculatorType, tuple] = {
+    CalculatorType.JOIST: ('Joist', ('depth', 'width', 'material', 'centres')),
+}
+
+
+def _intern(value: Any) -> Any:
+    """Intern short strings so repeated keys and categorical values share one object."""
+    if isinstance(value, str) and len(value) <= 32:
+        return sys.intern(value)
+    return value
+
+
+# Bounded so specs from imports and one-off registrations are evicted rather than
+# kept for the life of the process (mappingproxy objects can't be weakly referenced)
+@lru_cache(maxsize=1024)
+def _shared_specification(spec_key: tuple) -> Mapping[str, Any]:
+    """Read-only specification shared by all elements with the same (key, type, value) items."""
+    return MappingProxyType({key: value for key, _, value in spec_key})
+
+
+@dataclass(slots=True)
 class ElementSpecification:
     """Complete specification for a structural element."""
     code: str  # e.g., 'J1', 'S1', '1B3'
     calculator_type: CalculatorType
     description: str
-    specification: Dict[str, Any]  # Flexible spec based on element type
+    specification: Mapping[str, Any]  # Flexible spec based on element type; read-only once created
     category: str = ""  # e.g., 'Floor System', 'Wall Framing'
     active: bool = True  # Can disable without deleting
     custom_fields: Dict[str, Any] = field(default_factory=dict)
     
+    def __post_init__(self):
+        # Specs loaded from JSON carry fresh copies of keys like 'depth' and
+        # values like 'LVL'; intern them so all registered specs share them
+        self.category = _intern(self.category)
+        specification = {
+            _intern(key): _intern(value)
+            for key, value in self.specification.items()
+        }
+        
+        # Freeze the specification and reuse an existing identical one if present
+        try:
+            # Key on order and value type too, so a shared spec exports identically
+            spec_key = tuple((key, type(value), value) for key, value in specification.items())
+            hash(spec_key)
+        except TypeError:
+            # Unhashable values (e.g. lists) can't be deduplicated
+            self.specification = MappingProxyType(specification)
+            return
+        
+        self.specification = _shared_specification(spec_key)
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         return {
             'code': self.code,
             'calculator_type': self.calculator_type.value,
             'description': self.description,
-            'specification': self.specification,
+            'specification': dict(self.specification),
             'category': self.category,
             'active': self.active,
             'custom_fields': self.custom_fields
@@ -52,9 +102,42 @@ class ElementSpecification:
     @classmethod
     def from_dict(cls, data: Dict) -> 'ElementSpecification':
         """Create from dictionary."""
-        data = data.copy()
-        data['calculator_type'] = CalculatorType(data['calculator_type'])
-        return cls(**data)
+        return cls(
+            code=data['code'],
+            calculator_type=CalculatorType(data['calculator_type']),
+            description=data['description'],
+            specification=data['specification'],
+            category=data.get('category', ''),
+            active=data.get('active', True),
+            custom_fields=data.get('custom_fields', {})
+        )
+
+
+def _joist_element(
+    code: str,
+    depth: int,
+    centres: float,
+    material: str = 'LVL',
+    category: str = 'Floor System',
+    width: int = 45,
+    grade: str = 'E13'
+) -> ElementSpecification:
+    """Build a default joist-calculator element from the fields that vary."""
+    profile = f"{depth}x{width}"
+    return ElementSpecification(
+        code=code,
+        calculator_type=CalculatorType.JOIST,
+        description=f"{profile} {material} AT {round(centres * 1000)} CTS",
+        specification={
+            'depth': depth,
+            'width': width,
+            'material': material,
+            'grade': grade,
+            'centres': centres,
+            'standard_profile': profile
+        },
+        category=category
+    )
 
 
 class ElementTypeRegistry:
@@ -69,72 +152,34 @@ class ElementTypeRegistry:
     
     def __init__(self):
         self._types: Dict[str, ElementSpecification] = {}
+        self._types_view = MappingProxyType(self._types)
+        
+        # Secondary indexes, kept in registration order by register/remove
+        self._by_category: Dict[str, List[ElementSpecification]] = {}
+        self._by_calc_type: Dict[CalculatorType, List[ElementSpecification]] = {}
+        
+        # Active subset of _types, rebuilt lazily after any change
+        self._active_view: Mapping[str, ElementSpecification] = MappingProxyType({})
+        self._dirty = True
+        
+        # Callbacks run after any change, e.g. to drop caches built from lookups
+        self._change_listeners: List[Callable[[], None]] = []
+        
+        # Set during bulk imports so invalidation happens once at the end
+        self._suspend_invalidation = False
+        
         self._initialize_default_types()
     
     def _initialize_default_types(self):
         """Initialize with default element types."""
         
         # Joist types
-        self.register(ElementSpecification(
-            code='J1',
-            calculator_type=CalculatorType.JOIST,
-            description='200x45 LVL AT 450 CTS',
-            specification={
-                'depth': 200,
-                'width': 45,
-                'material': 'LVL',
-                'grade': 'E13',
-                'centres': 0.45,
-                'standard_profile': '200x45'
-            },
-            category='Floor System'
-        ))
-        
-        self.register(ElementSpecification(
-            code='J2',
-            calculator_type=CalculatorType.JOIST,
-            description='150x45 LVL AT 300 CTS',
-            specification={
-                'depth': 150,
-                'width': 45,
-                'material': 'LVL',
-                'grade': 'E13',
-                'centres': 0.30,
-                'standard_profile': '150x45'
-            },
-            category='Floor System'
-        ))
-        
-        self.register(ElementSpecification(
-            code='J3',
-            calculator_type=CalculatorType.JOIST,
-            description='240x45 LVL AT 600 CTS',
-            specification={
-                'depth': 240,
-                'width': 45,
-                'material': 'LVL',
-                'grade': 'E13',
-                'centres': 0.60,
-                'standard_profile': '240x45'
-            },
-            category='Floor System'
-        ))
+        self.register(_joist_element('J1', depth=200, centres=0.45))
+        self.register(_joist_element('J2', depth=150, centres=0.30))
+        self.register(_joist_element('J3', depth=240, centres=0.60))
         
         # Rafter types (using joist calculator)
-        self.register(ElementSpecification(
-            code='RX',
-            calculator_type=CalculatorType.JOIST,  # Can use joist calculator
-            description='130x45 LCL AT 450 CTS',
-            specification={
-                'depth': 130,
-                'width': 45,
-                'material': 'LCL',
-                'grade': 'E13',
-                'centres': 0.45,
-                'standard_profile': '130x45'
-            },
-            category='Roof System'
-        ))
+        self.register(_joist_element('RX', depth=130, centres=0.45, material='LCL', category='Roof System'))
         
         # Wall framing types (placeholder for future calculator)
         self.register(ElementSpecification(
@@ -206,7 +251,72 @@ class ElementTypeRegistry:
         Args:
             element: Element specification to register
         """
+        previous = self._types.get(element.code)
         self._types[element.code] = element
+        self._replace_in_index(self._by_category, 'category', element, previous)
+        self._replace_in_index(self._by_calc_type, 'calculator_type', element, previous)
+        self._mark_changed()
+    
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback to run whenever an element type is registered,
+        removed or deactivated.
+        
+        Args:
+            callback: Function taking no arguments
+        """
+        self._change_listeners.append(callback)
+    
+    def _mark_changed(self) -> None:
+        """Invalidate derived caches and notify change listeners."""
+        if self._suspend_invalidation:
+            return
+        self._dirty = True
+        for callback in self._change_listeners:
+            callback()
+    
+    def _replace_in_index(
+        self,
+        index: Dict[Any, List[ElementSpecification]],
+        attr: str,
+        element: ElementSpecification,
+        previous: Optional[ElementSpecification]
+    ) -> None:
+        """Add a newly registered element to a secondary index, replacing any previous version."""
+        key = getattr(element, attr)
+        if previous is None:
+            index.setdefault(key, []).append(element)
+            return
+        
+        previous_key = getattr(previous, attr)
+        if previous_key == key:
+            bucket = index[key]
+            for i, spec in enumerate(bucket):
+                if spec is previous:
+                    bucket[i] = element
+                    break
+        else:
+            # Moving between buckets; rebuild both to keep registration order
+            for bucket_key in (previous_key, key):
+                bucket = [spec for spec in self._types.values() if getattr(spec, attr) == bucket_key]
+                if bucket:
+                    index[bucket_key] = bucket
+                else:
+                    index.pop(bucket_key, None)
+    
+    def _remove_from_index(
+        self,
+        index: Dict[Any, List[ElementSpecification]],
+        attr: str,
+        element: ElementSpecification
+    ) -> None:
+        """Remove an element from a secondary index."""
+        key = getattr(element, attr)
+        bucket = [spec for spec in index[key] if spec is not element]
+        if bucket:
+            index[key] = bucket
+        else:
+            del index[key]
     
     def remove(self, code: str) -> bool:
         """
@@ -219,7 +329,10 @@ class ElementTypeRegistry:
             True if removed, False if not found
         """
         if code in self._types:
-            del self._types[code]
+            element = self._types.pop(code)
+            self._remove_from_index(self._by_category, 'category', element)
+            self._remove_from_index(self._by_calc_type, 'calculator_type', element)
+            self._mark_changed()
             return True
         return False
     
@@ -235,9 +348,18 @@ class ElementTypeRegistry:
         """
         if code in self._types:
             self._types[code].active = False
+            self._mark_changed()
             return True
         return False
     
+    def _rebuild_active_cache(self) -> None:
+        """Rebuild the cached active subset of element types."""
+        self._active_view = MappingProxyType({
+            code: spec for code, spec in self._types.items()
+            if spec.active
+        })
+        self._dirty = False
+    
     def get(self, code: str) -> Optional[ElementSpecification]:
         """
         Get an element specification by code.
@@ -250,7 +372,7 @@ class ElementTypeRegistry:
         """
         return self._types.get(code)
     
-    def get_all(self, active_only: bool = True) -> Dict[str, ElementSpecification]:
+    def get_all(self, active_only: bool = True) -> Mapping[str, ElementSpecification]:
         """
         Get all registered element types.
         
@@ -258,14 +380,13 @@ class ElementTypeRegistry:
             active_only: If True, only return active elements
         
         Returns:
-            Dictionary of element specifications
+            Read-only mapping of element specifications
         """
         if active_only:
-            return {
-                code: spec for code, spec in self._types.items()
-                if spec.active
-            }
-        return self._types.copy()
+            if self._dirty:
+                self._rebuild_active_cache()
+            return self._active_view
+        return self._types_view
     
     def get_by_category(self, category: str, active_only: bool = True) -> List[ElementSpecification]:
         """
@@ -278,12 +399,10 @@ class ElementTypeRegistry:
         Returns:
             List of element specifications
         """
-        elements = []
-        for spec in self._types.values():
-            if spec.category == category:
-                if not active_only or spec.active:
-                    elements.append(spec)
-        return elements
+        return [
+            spec for spec in self._by_category.get(category, ())
+            if not active_only or spec.active
+        ]
     
     def get_by_calculator_type(
         self,
@@ -300,12 +419,10 @@ class ElementTypeRegistry:
         Returns:
             List of element specifications
         """
-        elements = []
-        for spec in self._types.values():
-            if spec.calculator_type == calculator_type:
-                if not active_only or spec.active:
-                    elements.append(spec)
-        return elements
+        return [
+            spec for spec in self._by_calc_type.get(calculator_type, ())
+            if not active_only or spec.active
+        ]
     
     def get_categories(self) -> List[str]:
         """Get all unique categories."""
@@ -326,6 +443,10 @@ class ElementTypeRegistry:
             code: spec.to_dict()
             for code, spec in self._types.items()
         }
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        
+        import json  # Deferred; only needed for export/import
         return json.dumps(data, indent=2)
     
     def import_from_json(self, json_str: str) -> None:
@@ -335,10 +456,19 @@ class ElementTypeRegistry:
         Args:
             json_str: JSON string to import
         """
+        import json  # Deferred; only needed for export/import
         data = json.loads(json_str)
-        for code, spec_dict in data.items():
-            spec = ElementSpecification.from_dict(spec_dict)
-            self.register(spec)
+        if not data:
+            return
+        
+        self._suspend_invalidation = True
+        try:
+            for code, spec_dict in data.items():
+                spec = ElementSpecification.from_dict(spec_dict)
+                self.register(spec)
+        finally:
+            self._suspend_invalidation = False
+            self._mark_changed()
     
     def validate_specification(self, code: str) -> List[str]:
         """
@@ -361,18 +491,37 @@ class ElementTypeRegistry:
         if not spec.description:
             errors.append("Description is required")
         
-        # Calculator-specific validation
-        if spec.calculator_type == CalculatorType.JOIST:
-            required_fields = ['depth', 'width', 'material', 'centres']
-            for field in required_fields:
-                if field not in spec.specification:
-                    errors.append(f"Joist specification missing required field: {field}")
+        # Calculator-specific validation; only format errors when a field is missing
+        required = _REQUIRED_SPEC_FIELDS.get(spec.calculator_type)
+        if required:
+            label, fields = required
+            missing = [field for field in fields if field not in spec.specification]
+            if missing:
+                errors.extend(
+                    f"{label} specification missing required field: {field}"
+                    for field in missing
+                )
         
         return errors
 
 
-# Global registry instance
-element_registry = ElementTypeRegistry()
+# Global registry instance, built on first use by _get_registry
+_registry: Optional[ElementTypeRegistry] = None
+
+
+def _get_registry() -> ElementTypeRegistry:
+    """Return the global registry instance, creating it on first use."""
+    global _registry
+    if _registry is None:
+        _registry = ElementTypeRegistry()
+    return _registry
+
+
+def __getattr__(name: str) -> Any:
+    # The global registry instance is built on first access rather than at import
+    if name == 'element_registry':
+        return _get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_element_type(code: str) -> Optional[ElementSpecification]:
@@ -385,10 +534,10 @@ def get_element_type(code: str) -> Optional[ElementSpecification]:
     Returns:
         Element specification or None
     """
-    return element_registry.get(code)
+    return _get_registry().get(code)
 
 
-def get_all_element_types(active_only: bool = True) -> Dict[str, ElementSpecification]:
+def get_all_element_types(active_only: bool = True) -> Mapping[str, ElementSpecification]:
     """
     Convenience function to get all element types.
     
@@ -396,6 +545,6 @@ def get_all_element_types(active_only: bool = True) -> Dict[str, ElementSpecific
         active_only: If True, only return active elements
     
     Returns:
-        Dictionary of element specifications
+        Read-only mapping of element specifications
     """
-    return element_registry.get_all(active_only)
\ No newline at end of file
+    return _get_registry().get_all(active_only)
\ No newline at end of file
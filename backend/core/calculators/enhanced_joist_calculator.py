@@ -12,22 +12,25 @@ This module implements the complete joist calculation system with:
 Based on Australian Standard AS1684 and real-world construction practices.
 """
 
-import math
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import sys
+from bisect import insort
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple, Iterator
+from functools import lru_cache
 
 from .base_calculator import (
     ConstructionCalculator,
     StandardLengthsRegistry,
     OptimizationUtilities,
-    CalculationFormatter
+    CalculationFormatter,
+    ceil_div_mm,
+    round_up_to_standard_length
 )
 from ..materials.material_system import MaterialSystem
 
 
-@dataclass
-class JoistSpec:
-    """Data class to store joist specifications"""
+class JoistSpec(NamedTuple):
+    """Immutable record of a joist specification"""
     name: str
     depth: int  # mm
     width: int  # mm
@@ -68,6 +71,51 @@ JOIST_TYPES = {
     )
 }
 
+# Fixed lines of the formatted output
+_HEADER_JOISTS = "Joist Lengths:"
+_HEADER_BLOCKING = "Joist Blocking:"
+_HEADER_LEDGER = "Ledger Board/Rim Board:"
+_HEADER_CUTTING_LIST = "Cutting List:"
+_HEADER_CONSOLIDATED = "CONSOLIDATED CUTTING LIST - ALL AREAS"
+_NO_BLOCKING_LINE = "No Blocking"
+_RULE = "=" * 60
+_SUMMARY_RULE = "\n" + "-" * 60
+
+# joist_spec section of each result, built once per type and copied per calculation
+_JOIST_SPEC_DICTS = {code: spec._asdict() for code, spec in JOIST_TYPES.items()}
+
+# Interned material specification per type, shared by every result and consolidation key
+_MATERIAL_SPECS = {
+    code: sys.intern(f"{spec.depth} x {spec.width} {spec.grade} {spec.material}")
+    for code, spec in JOIST_TYPES.items()
+}
+
+
+@lru_cache(maxsize=4096)
+def _best_blocking_length(
+    total_length: float,
+    blocking_lengths: Tuple[float, ...]
+) -> Tuple[float, int, float]:
+    """
+    Pick the blocking stock length that leaves the least offcut.
+    
+    Args:
+        total_length: Total blocking length needed in meters
+        blocking_lengths: Available blocking lengths
+    
+    Returns:
+        Tuple of (standard length, pieces needed, waste percent)
+    """
+    # Argmin over (pieces, length) candidates; min() keeps the first on ties
+    pieces_needed, blength = min(
+        ((ceil_div_mm(total_length, blength), blength) for blength in blocking_lengths),
+        key=lambda option: option[0] * option[1] - total_length
+    )
+    total_ordered = pieces_needed * blength
+    waste = total_ordered - total_length
+    
+    return blength, pieces_needed, (waste / total_ordered) * 100
+
 
 class EnhancedJoistCalculator(ConstructionCalculator):
     """
@@ -87,8 +135,12 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         """
         self.set_joist_type(joist_type)
         self.all_areas = {}  # Store all calculations for consolidation
+        self._consolidated_cache: Optional[str] = None  # Reset whenever all_areas changes
+        self._area_cuts: Dict[str, Tuple[str, Tuple[Tuple[int, int], ...]]] = {}  # Mirrors all_areas
         self.standard_lengths = StandardLengthsRegistry.TIMBER_LENGTHS
+        self._sorted_std = tuple(sorted(self.standard_lengths))
         self.blocking_lengths = StandardLengthsRegistry.BLOCKING_LENGTHS
+        self._blocking_tuple = tuple(self.blocking_lengths)
         self.material_system = MaterialSystem()
     
     def set_joist_type(self, joist_type: str) -> None:
@@ -125,12 +177,12 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         Returns:
             Complete calculation results including all details
         """
-        # Validate dimensions
-        self.validate_dimensions(dimensions)
-        
-        # Extract parameters
-        width = dimensions['width']
-        length = dimensions['length']
+        # Extract and validate parameters in one pass; only these two are used
+        width = dimensions.get('width')
+        length = dimensions.get('length')
+        for key, value in (('width', width), ('length', length)):
+            if value is None or value <= 0:
+                raise ValueError(f"{key} must be a positive number")
         
         # Process options
         options = options or {}
@@ -147,7 +199,7 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         
         # Calculate number of joists
         joists_calculated = width / centre_spacing
-        number_of_joists = math.ceil(joists_calculated)
+        number_of_joists = ceil_div_mm(width, centre_spacing)
         
         calculation_notes.append(
             f"Joist calculation: {width:.3f}m ÷ {centre_spacing} = "
@@ -183,15 +235,7 @@ class EnhancedJoistCalculator(ConstructionCalculator):
             
             # Joist type information
             'joist_type': self.joist_type,
-            'joist_spec': {
-                'name': self.spec.name,
-                'depth': self.spec.depth,
-                'width': self.spec.width,
-                'material': self.spec.material,
-                'centres': self.spec.centres,
-                'description': self.spec.description,
-                'grade': self.spec.grade
-            },
+            'joist_spec': dict(_JOIST_SPEC_DICTS[self.joist_type]),
             
             # Dimensions
             'width': width,
@@ -217,7 +261,7 @@ class EnhancedJoistCalculator(ConstructionCalculator):
             'ledger_actual_length': width,
             
             # Material specification
-            'material_specification': f"{self.spec.depth} x {self.spec.width} {self.spec.grade} {self.spec.material}",
+            'material_specification': _MATERIAL_SPECS[self.joist_type],
             
             # Notes and assumptions
             'calculation_notes': calculation_notes,
@@ -227,9 +271,42 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         # Store for consolidation
         area_key = f"{self.joist_type}{area_suffix}"
         self.all_areas[area_key] = result
+        self._area_cuts[area_key] = (result['material_specification'], self._cut_items(result))
+        self._consolidated_cache = None
         
         return result
     
+    @staticmethod
+    def _cut_items(result: Dict) -> Tuple[Tuple[int, int], ...]:
+        """
+        Reduce a calculation result to its cutting list contributions.
+        
+        Lengths are returned in whole decimetres, the resolution the cutting
+        list is printed at, so consolidation only has to add integers.
+        
+        Args:
+            result: Calculation result dictionary
+        
+        Returns:
+            Tuple of (length in decimetres, quantity) pairs
+        """
+        # Ledger/rim board
+        items = [(round(result['ledger_standard'] * 10), result['ledger_pieces'])]
+        
+        # Blocking if required
+        blocking = result['blocking']
+        if blocking['required']:
+            items.append((round(blocking['standard_length'] * 10), blocking['pieces']))
+        
+        # Joists
+        optimization = result['optimization']
+        if optimization and optimization['optimized']:
+            items.append((round(optimization['standard_length'] * 10), optimization['pieces_needed']))
+        else:
+            items.append((round(result['joist_standard_length'] * 10), result['number_of_joists']))
+        
+        return tuple(items)
+    
     def round_to_standard_length(self, length: float) -> float:
         """
         Round up to next standard timber length.
@@ -243,12 +320,7 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         if length <= 3.0:
             return 3.0
         
-        for standard in self.standard_lengths:
-            if standard >= length:
-                return standard
-        
-        # If no standard length is long enough, round up to nearest 0.6m
-        return math.ceil(length / 0.6) * 0.6
+        return round_up_to_standard_length(length, self._sorted_std)
     
     def optimize_short_lengths(self, num_pieces: int, piece_length: float) -> Optional[Dict]:
         """
@@ -298,28 +370,15 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         # Blocking spacing as per AS1684
         blocking_spacing = 1.2  # meters
         blocking_calculated = length / blocking_spacing
-        rows_of_blocking = math.ceil(blocking_calculated)
+        rows_of_blocking = ceil_div_mm(length, blocking_spacing)
         
         # Total blocking length needed
         total_blocking_length = rows_of_blocking * width
         
         # Optimize blocking lengths
-        best_option = None
-        min_waste = float('inf')
-        
-        for blength in self.blocking_lengths:
-            pieces_needed = math.ceil(total_blocking_length / blength)
-            total_ordered = pieces_needed * blength
-            waste = total_ordered - total_blocking_length
-            waste_percent = (waste / total_ordered) * 100
-            
-            if waste < min_waste:
-                min_waste = waste
-                best_option = {
-                    'length': blength,
-                    'pieces': pieces_needed,
-                    'waste_percent': waste_percent
-                }
+        blength, pieces_needed, waste_percent = _best_blocking_length(
+            total_blocking_length, self._blocking_tuple
+        )
         
         return {
             'required': True,
@@ -327,11 +386,11 @@ class EnhancedJoistCalculator(ConstructionCalculator):
             'rows_calculated': blocking_calculated,
             'rows': rows_of_blocking,
             'total_length': total_blocking_length,
-            'pieces': best_option['pieces'],
-            'standard_length': best_option['length'],
-            'waste_percent': best_option['waste_percent'],
+            'pieces': pieces_needed,
+            'standard_length': blength,
+            'waste_percent': waste_percent,
             'calculation': f"{length:.3f}m / {blocking_spacing}m = {blocking_calculated:.3f} => {rows_of_blocking} rows of Blocking",
-            'row_calculation': f"{rows_of_blocking} Rows of Blocking x {width:.3f}m = {total_blocking_length:.2f}m = {best_option['pieces']} Lengths @ {best_option['length']}m"
+            'row_calculation': f"{rows_of_blocking} Rows of Blocking x {width:.3f}m = {total_blocking_length:.2f}m = {pieces_needed} Lengths @ {blength}m"
         }
     
     def format_output(self, result: Dict) -> str:
@@ -344,75 +403,74 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         Returns:
             Formatted string for display
         """
-        lines = []
+        return "\n".join(self.iter_output(result))
+    
+    def iter_output(self, result: Dict) -> Iterator[str]:
+        """
+        Yield the lines of format_output() one at a time.
+        
+        Callers that only need the first few lines (e.g. a preview) can stop
+        early without the later sections being formatted.
         
-        # Header
-        area_key = f"{result['joist_type']}{result['area_suffix']}"
-        lines.append(f"{area_key}:")
-        lines.append("")
+        Args:
+            result: Calculation result dictionary
         
-        # Joist calculations
-        lines.append("Joist Lengths:")
-        calc_line = (
+        Yields:
+            Formatted output lines, without trailing newlines
+        """
+        blocking = result['blocking']
+        optimization = result['optimization']
+        optimized = optimization and optimization['optimized']
+        
+        # Header and joist calculations
+        yield f"{result['joist_type']}{result['area_suffix']}:"
+        yield ""
+        yield _HEADER_JOISTS
+        yield (
             f"{result['width']:.3f}m / {result['centre_spacing']} (centres) = "
             f"{result['joists_calculated']:.3f} => {result['number_of_joists']} "
             f"Lengths @ {result['joist_standard_length']}m"
         )
-        lines.append(calc_line)
         
         # Optimization note if applicable
-        if result['optimization'] and result['optimization']['optimized']:
-            lines.append(f"Optimization: {result['optimization']['calculation']}")
-        
-        lines.append("")
+        if optimized:
+            yield f"Optimization: {optimization['calculation']}"
         
         # Blocking section
-        lines.append("Joist Blocking:")
-        if result['blocking']['required']:
-            lines.append(result['blocking']['calculation'])
-            lines.append("")
-            lines.append(result['blocking']['row_calculation'])
+        yield ""
+        yield _HEADER_BLOCKING
+        if blocking['required']:
+            yield blocking['calculation']
+            yield ""
+            yield blocking['row_calculation']
         else:
-            lines.append("No Blocking")
-        
-        lines.append("")
-        
-        # Ledger/Rim board
-        lines.append("Ledger Board/Rim Board:")
-        lines.append(
-            f"2 x {result['width']:.3f}m = {result['ledger_pieces']} "
-            f"Lengths @ {result['ledger_standard']:.1f}m"
-        )
-        
-        lines.append("")
-        
-        # Cutting list
-        lines.append("Cutting List:")
-        lines.append(result['material_specification'])
-        
-        # Ledger pieces
-        lines.append(f"{result['ledger_pieces']} Lengths @ {result['ledger_standard']:.1f}m")
+            yield _NO_BLOCKING_LINE
+        
+        # Ledger/Rim board, then the cutting list which repeats the ledger line
+        ledger_line = f"{result['ledger_pieces']} Lengths @ {result['ledger_standard']:.1f}m"
+        yield ""
+        yield _HEADER_LEDGER
+        yield f"2 x {result['width']:.3f}m = {ledger_line}"
+        yield ""
+        yield _HEADER_CUTTING_LIST
+        yield result['material_specification']
+        yield ledger_line
         
         # Blocking pieces
-        if result['blocking']['required']:
-            lines.append(
-                f"{result['blocking']['pieces']} Lengths @ "
-                f"{result['blocking']['standard_length']:.1f}m"
-            )
+        if blocking['required']:
+            yield f"{blocking['pieces']} Lengths @ {blocking['standard_length']:.1f}m"
         
         # Joist pieces
-        if result['optimization'] and result['optimization']['optimized']:
-            lines.append(
-                f"{result['optimization']['pieces_needed']} Lengths @ "
-                f"{result['optimization']['standard_length']:.1f}m (cut up)"
+        if optimized:
+            yield (
+                f"{optimization['pieces_needed']} Lengths @ "
+                f"{optimization['standard_length']:.1f}m (cut up)"
             )
         else:
-            lines.append(
+            yield (
                 f"{result['number_of_joists']} Lengths @ "
                 f"{result['joist_standard_length']:.1f}m"
             )
-        
-        return "\n".join(lines)
     
     def generate_consolidated_cutting_list(self) -> str:
         """
@@ -424,49 +482,32 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         if not self.all_areas:
             return "No areas calculated yet."
         
-        lines = []
-        lines.append("\n" + "="*60)
-        lines.append("CONSOLIDATED CUTTING LIST - ALL AREAS")
-        lines.append("="*60)
+        if self._consolidated_cache is not None:
+            return self._consolidated_cache
         
-        # Consolidate materials by specification and length
-        consolidated = {}
+        lines = ["\n" + _RULE, _HEADER_CONSOLIDATED, _RULE]
         
-        for area_key, result in self.all_areas.items():
-            material_spec = result['material_specification']
-            
-            # Add ledger/rim board
-            key = (material_spec, result['ledger_standard'])
-            consolidated[key] = consolidated.get(key, 0) + result['ledger_pieces']
-            
-            # Add blocking if required
-            if result['blocking']['required']:
-                key = (material_spec, result['blocking']['standard_length'])
-                consolidated[key] = consolidated.get(key, 0) + result['blocking']['pieces']
-            
-            # Add joists
-            if result['optimization'] and result['optimization']['optimized']:
-                key = (material_spec, result['optimization']['standard_length'])
-                consolidated[key] = consolidated.get(key, 0) + result['optimization']['pieces_needed']
-            else:
-                key = (material_spec, result['joist_standard_length'])
-                consolidated[key] = consolidated.get(key, 0) + result['number_of_joists']
-        
-        # Group by material specification
-        materials = {}
-        for (material_spec, length), quantity in consolidated.items():
-            if material_spec not in materials:
-                materials[material_spec] = []
-            materials[material_spec].append((length, quantity))
+        # Consolidate quantities per material specification, then per length.
+        # Each area's contributions were reduced to integer pairs in calculate(),
+        # and each material's lengths are kept sorted as they first appear.
+        consolidated: Dict[str, Counter] = defaultdict(Counter)
+        length_order: Dict[str, List[int]] = defaultdict(list)
+        
+        for material_spec, cuts in self._area_cuts.values():
+            lengths = consolidated[material_spec]
+            for decimetres, quantity in cuts:
+                if decimetres not in lengths:
+                    insort(length_order[material_spec], decimetres)
+                lengths[decimetres] += quantity
         
         # Format output
-        for material_spec, lengths in materials.items():
+        for material_spec, lengths in consolidated.items():
             lines.append(f"\n{material_spec}:")
-            for length, quantity in sorted(lengths):
-                lines.append(f"  {quantity} Lengths @ {length:.1f}m")
+            for decimetres in length_order[material_spec]:
+                lines.append(f"  {lengths[decimetres]} Lengths @ {decimetres / 10:.1f}m")
         
         # Summary
-        lines.append("\n" + "-"*60)
+        lines.append(_SUMMARY_RULE)
         lines.append(f"Total areas calculated: {len(self.all_areas)}")
         lines.append("Areas included: " + ", ".join(self.all_areas.keys()))
         
@@ -474,11 +515,14 @@ class EnhancedJoistCalculator(ConstructionCalculator):
         total_area = sum(result['area_m2'] for result in self.all_areas.values())
         lines.append(f"Total floor area: {total_area:.1f} m²")
         
-        return "\n".join(lines)
+        self._consolidated_cache = "\n".join(lines)
+        return self._consolidated_cache
     
     def clear_areas(self) -> None:
         """Clear all stored area calculations."""
         self.all_areas = {}
+        self._area_cuts = {}
+        self._consolidated_cache = None
     
     def get_area_summary(self) -> List[Dict]:
         """
@@ -7,14 +7,15 @@ using the element registry data. It provides basic material calculations
 when a specific calculator implementation doesn't exist yet.
 """
 
-import math
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional
 
 from .base_calculator import (
     ConstructionCalculator,
     StandardLengthsRegistry,
     OptimizationUtilities,
-    CalculationFormatter
+    CalculationFormatter,
+    ceil_div_mm
 )
 from .element_types import ElementSpecification
 
@@ -30,11 +31,15 @@ class GenericCalculator(ConstructionCalculator):
     - Serves as a fallback for unimplemented calculators
     """
     
+    # Oldest results are dropped beyond this, so a long-lived instance stays bounded
+    MAX_HISTORY = 10000
+    
     def __init__(self):
         """Initialize generic calculator."""
         self.element_spec: Optional[ElementSpecification] = None
+        self._material_spec = ""  # Built once per configured element
         self.standard_lengths = StandardLengthsRegistry.TIMBER_LENGTHS
-        self.calculation_history = []
+        self.calculation_history: Deque[Dict] = deque(maxlen=self.MAX_HISTORY)
     
     def configure_for_element(self, element_spec: ElementSpecification) -> None:
         """
@@ -45,6 +50,9 @@ class GenericCalculator(ConstructionCalculator):
         """
         self.element_spec = element_spec
         
+        # Specifications are frozen, so the material string can be built up front
+        self._material_spec = self._build_material_spec(element_spec.specification)
+        
         # Adjust standard lengths based on material type
         if element_spec.specification.get('material') == 'Steel':
             self.standard_lengths = StandardLengthsRegistry.STEEL_LENGTHS
@@ -111,7 +119,7 @@ class GenericCalculator(ConstructionCalculator):
             result.update(self._calculate_length_based(width, length, spec))
         
         # Add material specification
-        result['material_specification'] = self._build_material_spec(spec)
+        result['material_specification'] = self._material_spec
         
         # Add reference code
         result['reference_code'] = f"{building_level}-{self.element_spec.code}{area_suffix}"
@@ -137,7 +145,7 @@ class GenericCalculator(ConstructionCalculator):
         
         # Calculate number of members
         calculated = width / centres
-        count = math.ceil(calculated)
+        count = ceil_div_mm(width, centres)
         
         # Determine standard length
         standard_length = StandardLengthsRegistry.get_optimal_length(length)
@@ -315,24 +323,19 @@ class GenericCalculator(ConstructionCalculator):
         Returns:
             List of cutting list items
         """
-        if not self.calculation_history:
-            return []
-        
-        cutting_list = []
-        
-        for calc in self.calculation_history:
-            if 'member_count' in calc and 'standard_length' in calc:
-                cutting_list.append({
-                    'reference': calc['reference_code'],
-                    'specification': calc['material_specification'],
-                    'quantity': calc['member_count'],
-                    'length': calc['standard_length'],
-                    'actual_length': calc.get('member_length', 0),
-                    'application': calc['element_description']
-                })
-        
-        return cutting_list
+        return [
+            {
+                'reference': calc['reference_code'],
+                'specification': calc['material_specification'],
+                'quantity': calc['member_count'],
+                'length': calc['standard_length'],
+                'actual_length': calc.get('member_length', 0),
+                'application': calc['element_description']
+            }
+            for calc in self.calculation_history
+            if 'member_count' in calc and 'standard_length' in calc
+        ]
     
     def clear_history(self) -> None:
         """Clear calculation history."""
-        self.calculation_history = []
\ No newline at end of file
+        self.calculation_history.clear()
\ No newline at end of file
@@ -1,7 +1,11 @@
 import math
-from typing import Dict, List, Optional, Any
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from core.materials.material_system import MaterialSystem
+from .base_calculator import ceil_div_mm
 
 # Import enhanced calculator functionality
 try:
@@ -10,7 +14,65 @@ try:
 except ImportError:
     ENHANCED_AVAILABLE = False
 
-@dataclass
+# Note templates for calculate_joists; %-formatting is the cheapest interpolation for these
+_SPACING_NOTE = "Non-standard joist spacing: %sm"
+_JOIST_COUNT_NOTE = "Joist calculation: %sm ÷ %sm = %.3f → %d joists"
+_JOIST_LENGTH_NOTE = "Joist length: %sm + %sm bearing = %sm"
+_BLOCKING_NOTE = "Blocking: %d rows × %sm = %sm"
+
+# AS1684 blocking: one row per 2.4m of span, capped at 4; bisect_left keeps each break inclusive
+_BLOCKING_ROW_BREAKS = (2.4, 4.8, 7.2)
+
+# Longest total (in cm) solved exactly; anything beyond is pre-filled with the longest board
+_COVER_DP_WINDOW_CM = 10000
+
+
+@lru_cache(maxsize=256)
+def _cover_length_cm(total_cm: int, lengths_cm: Tuple[int, ...]) -> Tuple[Tuple[int, int], ...]:
+    """
+    Choose standard boards whose combined length covers total_cm with the least offcut.
+    
+    Unbounded-knapsack DP over a length axis: boards[s] is the fewest boards
+    summing to exactly s. The answer is the smallest reachable s >= total_cm,
+    so ties on total length go to the combination with fewer boards.
+    
+    Every combination is a multiple of the lengths' GCD (60cm for standard
+    stock), so the axis is stepped in GCD units rather than centimetres.
+    
+    Returns:
+        Tuple of (board length in cm, count) pairs, longest first
+    """
+    longest_cm = max(lengths_cm)
+    prefill = max(0, (total_cm - _COVER_DP_WINDOW_CM) // longest_cm)
+    step = math.gcd(*lengths_cm)
+    units = tuple(length // step for length in lengths_cm)
+    longest = longest_cm // step
+    target = -(-(total_cm - prefill * longest_cm) // step)
+    limit = target + longest
+    
+    boards: List[Optional[int]] = [0] + [None] * limit
+    parent = [0] * (limit + 1)
+    for s in range(1, limit + 1):
+        for length in units:
+            if length <= s and boards[s - length] is not None:
+                count = boards[s - length] + 1
+                if boards[s] is None or count < boards[s]:
+                    boards[s] = count
+                    parent[s] = length
+    
+    # Always found: ceil(target / longest) longest boards fit below limit
+    s = next(s for s in range(target, limit + 1) if boards[s] is not None)
+    used = Counter()
+    while s:
+        used[parent[s] * step] += 1
+        s -= parent[s]
+    if prefill:
+        used[longest_cm] += prefill
+    
+    return tuple(sorted(used.items(), reverse=True))
+
+
+@dataclass(slots=True, frozen=True)
 class JoistCalculationResult:
     joist_count: int
     joist_length: float
@@ -28,6 +90,9 @@ class JoistCalculator:
     def __init__(self, use_enhanced: bool = True):
         self.material_system = MaterialSystem()
         self.standard_lengths = self.material_system.get_standard_lengths()
+        self._sorted_lengths = tuple(sorted(self.standard_lengths))
+        self._lengths_by_cm = {round(length * 100): length for length in self._sorted_lengths}
+        self._lengths_cm = tuple(self._lengths_by_cm)
         
         # Use enhanced calculator if available and requested
         if use_enhanced and ENHANCED_AVAILABLE:
@@ -65,26 +130,26 @@ class JoistCalculator:
             raise ValueError("Joist spacing must be a positive number")
         
         if joist_spacing not in self.material_system.get_standard_spacings():
-            assumptions.append(f"Non-standard joist spacing: {joist_spacing}m")
+            assumptions.append(_SPACING_NOTE % joist_spacing)
         
-        # Calculate number of joists
+        # Calculate number of joists; on whole millimetres, so exact multiples don't gain a joist
         joist_count_raw = span_length / joist_spacing
-        joist_count = math.ceil(joist_count_raw)
+        joist_count = ceil_div_mm(span_length, joist_spacing)
         
-        calculation_notes.append(f"Joist calculation: {span_length}m ÷ {joist_spacing}m = {joist_count_raw:.3f} → {joist_count} joists")
+        calculation_notes.append(_JOIST_COUNT_NOTE % (span_length, joist_spacing, joist_count_raw, joist_count))
         
         # Determine joist length (typically span length + bearing allowance)
         bearing_allowance = 0.1  # 100mm bearing each end
         joist_length = span_length + (2 * bearing_allowance)
         
-        calculation_notes.append(f"Joist length: {span_length}m + {2 * bearing_allowance}m bearing = {joist_length}m")
+        calculation_notes.append(_JOIST_LENGTH_NOTE % (span_length, 2 * bearing_allowance, joist_length))
         
         # Calculate blocking requirements
         blocking_rows = self._calculate_blocking_rows(span_length)
         blocking_length_per_row = span_length
         total_blocking_length = blocking_rows * blocking_length_per_row
         
-        calculation_notes.append(f"Blocking: {blocking_rows} rows × {blocking_length_per_row}m = {total_blocking_length}m")
+        calculation_notes.append(_BLOCKING_NOTE % (blocking_rows, blocking_length_per_row, total_blocking_length))
         
         # Get material specification
         material_info = self.material_system.get_joist_material(span_length, load_type)
@@ -123,14 +188,7 @@ class JoistCalculator:
         Calculate number of blocking rows required
         Based on AS1684 - typically 1 row per 2.4m of span
         """
-        if span_length <= 2.4:
-            return 1
-        elif span_length <= 4.8:
-            return 2
-        elif span_length <= 7.2:
-            return 3
-        else:
-            return 4
+        return bisect_left(_BLOCKING_ROW_BREAKS, span_length) + 1
     
     def _generate_reference_code(self, building_level: str, component_type: str, sequence: int) -> str:
         """
@@ -207,60 +265,58 @@ class JoistCalculator:
             total_length_needed = required_length * quantity
             optimized_pieces = self._optimize_total_length(total_length_needed)
             
-            for i, piece in enumerate(optimized_pieces):
+            for i, (quantity, length, cut_length, waste) in enumerate(optimized_pieces, 1):
                 cutting_list.append({
                     "profile_size": material_spec,
-                    "quantity": piece["quantity"],
-                    "length": piece["length"],
-                    "cut_length": piece["cut_length"],
-                    "reference": f"{reference_code}-{i+1}",
+                    "quantity": quantity,
+                    "length": length,
+                    "cut_length": cut_length,
+                    "reference": f"{reference_code}-{i}",
                     "application": application,
-                    "waste": piece["waste"]
+                    "waste": waste
                 })
         
         return cutting_list
     
     def _find_optimal_length(self, required_length: float) -> float:
         """Find the shortest standard length that fits the required length"""
-        for standard_length in sorted(self.standard_lengths):
-            if standard_length >= required_length:
-                return standard_length
+        i = bisect_left(self._sorted_lengths, required_length)
+        if i < len(self._sorted_lengths):
+            return self._sorted_lengths[i]
         
         # If no standard length is long enough, use the longest
-        return max(self.standard_lengths)
+        return self._sorted_lengths[-1]
     
-    def _optimize_total_length(self, total_length: float) -> List[Dict]:
+    def _optimize_total_length(self, total_length: float) -> List[Tuple[int, float, float, float]]:
         """
         Optimize cutting pattern for total length requirement
-        This is a simplified version - could be improved with dynamic programming
+        Picks the combination of standard lengths with the least total offcut
+        (see _cover_length_cm); repeat totals are served from its cache
+        
+        Returns (quantity, length, cut_length, waste) tuples; _optimize_cutting
+        turns each into its cutting list row, so no intermediate dicts are built
         """
-        pieces = []
-        remaining_length = total_length
+        if total_length <= 0:
+            return []
         
-        # Use largest standard lengths first to minimize waste
-        for standard_length in sorted(self.standard_lengths, reverse=True):
-            if remaining_length <= 0:
-                break
-            
-            quantity_needed = int(remaining_length / standard_length)
-            if quantity_needed > 0:
-                cut_length = min(standard_length, remaining_length)
-                pieces.append({
-                    "quantity": quantity_needed,
-                    "length": standard_length,
-                    "cut_length": cut_length,
-                    "waste": standard_length - cut_length
-                })
-                remaining_length -= quantity_needed * cut_length
+        # Round up to whole centimetres so the boards always cover the requirement
+        total_cm = math.ceil(round(total_length * 100, 6))
+        boards = _cover_length_cm(total_cm, self._lengths_cm)
         
-        # Handle any remaining length
-        if remaining_length > 0:
-            optimal_length = self._find_optimal_length(remaining_length)
-            pieces.append({
-                "quantity": 1,
-                "length": optimal_length,
-                "cut_length": remaining_length,
-                "waste": optimal_length - remaining_length
-            })
+        lengths_by_cm = self._lengths_by_cm
+        pieces = [
+            (quantity, lengths_by_cm[length_cm], lengths_by_cm[length_cm], 0.0)
+            for length_cm, quantity in boards
+        ]
+        
+        # The whole offcut comes from one of the shortest boards used; it is
+        # always shorter than any board, otherwise that board could be dropped
+        ordered_length = sum(lengths_by_cm[cm] * quantity for cm, quantity in boards)
+        waste = ordered_length - total_length
+        if waste > 1e-9:
+            quantity, length, _, _ = pieces.pop()
+            if quantity > 1:
+                pieces.append((quantity - 1, length, length, 0.0))
+            pieces.append((1, length, length - waste, waste))
         
         return pieces
\ No newline at end of file
@@ -1,6 +1,8 @@
-from typing import Dict, List, Optional
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 class MaterialType(Enum):
     LVL = "LVL"
@@ -15,22 +17,58 @@ class MaterialGrade(Enum):
     MGP10 = "MGP10"
     MGP12 = "MGP12"
 
-@dataclass
+@dataclass(slots=True)
 class MaterialSpecification:
     profile: str  # e.g., "200x45", "90x45"
     grade: MaterialGrade
     type: MaterialType
     specification_code: str  # e.g., "200x45 E13 LVL", "90x45 H2 MGP10"
-    standard_lengths: List[float]  # Available lengths in meters
+    standard_lengths: Tuple[float, ...]  # Available lengths in meters, shared by every spec
     application: str  # Primary use case
     load_capacity: Optional[float] = None
     cost_per_meter: Optional[float] = None
 
+# Standard stock lengths in meters; one immutable tuple shared by every specification
+_STANDARD_LENGTHS = (3.0, 3.6, 4.2, 4.8, 5.4, 6.0, 6.6, 7.2, 7.8)
+
+# Simplified maximum span per joist profile, in meters
+_SPAN_FACTORS = {
+    "150x45": 3.0,
+    "200x45": 4.2,
+    "240x45": 6.0,
+    "200x63": 7.2
+}
+
+# Span upper bounds (inclusive) and the joist material chosen within each band
+_SPAN_BREAKS = (3.0, 4.2, 6.0)
+_SPAN_MATERIALS = ("150x45 E13 LVL", "200x45 E13 LVL", "240x45 E13 LVL", "200x63 E13 LVL")
+_SPAN_ASSUMPTIONS = (
+    "Selected 150x45 E13 LVL for span ≤3.0m (actual: {}m)",
+    "Selected 200x45 E13 LVL for span ≤4.2m (actual: {}m)",
+    "Selected 240x45 E13 LVL for span ≤6.0m (actual: {}m)",
+    "Selected 200x63 E13 LVL for span >6.0m (actual: {}m)",
+)
+
+# typed=True: 3 and 3.0 must stay separate keys, the span is echoed in the notes
+@lru_cache(maxsize=256, typed=True)
+def _select_joist_material(span_length: float, load_type: str) -> Tuple[str, Tuple[str, ...]]:
+    """Pick the joist specification code and assumption notes for a span and load type"""
+    # Material selection based on span length; bisect_left keeps each break inclusive
+    band = bisect_left(_SPAN_BREAKS, span_length)
+    assumptions = [_SPAN_ASSUMPTIONS[band].format(span_length)]
+    
+    # Additional assumptions based on load type
+    if load_type == "residential":
+        assumptions.append("Assumed residential loading (1.5 kPa live load)")
+    
+    return _SPAN_MATERIALS[band], tuple(assumptions)
+
 class MaterialSystem:
     def __init__(self):
-        self.standard_lengths = [3.0, 3.6, 4.2, 4.8, 5.4, 6.0, 6.6, 7.2, 7.8]
+        self.standard_lengths = _STANDARD_LENGTHS
         self.standard_spacings = [0.3, 0.45, 0.6]  # 300mm, 450mm, 600mm centers
         self.materials = self._initialize_materials()
+        self._build_material_summaries()
     
     def _initialize_materials(self) -> Dict[str, MaterialSpecification]:
         """Initialize material database based on client examples"""
@@ -108,31 +146,15 @@ class MaterialSystem:
         """
         Determine appropriate joist material based on span length and load requirements
         Following Australian residential construction standards
+        Selection is memoized per (span, load type); each call gets its own assumptions list
         """
-        assumptions = []
-        
-        # Material selection logic based on span length
-        if span_length <= 3.0:
-            selected_material = self.materials["150x45 E13 LVL"]
-            assumptions.append(f"Selected 150x45 E13 LVL for span ≤3.0m (actual: {span_length}m)")
-        elif span_length <= 4.2:
-            selected_material = self.materials["200x45 E13 LVL"]
-            assumptions.append(f"Selected 200x45 E13 LVL for span ≤4.2m (actual: {span_length}m)")
-        elif span_length <= 6.0:
-            selected_material = self.materials["240x45 E13 LVL"]
-            assumptions.append(f"Selected 240x45 E13 LVL for span ≤6.0m (actual: {span_length}m)")
-        else:
-            selected_material = self.materials["200x63 E13 LVL"]
-            assumptions.append(f"Selected 200x63 E13 LVL for span >6.0m (actual: {span_length}m)")
-        
-        # Additional assumptions based on load type
-        if load_type == "residential":
-            assumptions.append("Assumed residential loading (1.5 kPa live load)")
+        code, assumptions = _select_joist_material(span_length, load_type)
+        selected_material = self.materials[code]
         
         return {
             "specification": selected_material.specification_code,
             "material": selected_material,
-            "assumptions": assumptions
+            "assumptions": list(assumptions)
         }
     
     def get_wall_framing_material(self, wall_type: str = "internal") -> Dict:
@@ -151,7 +173,7 @@ class MaterialSystem:
     
     def get_standard_lengths(self) -> List[float]:
         """Get standard material lengths"""
-        return self.standard_lengths
+        return list(self.standard_lengths)
     
     def get_standard_spacings(self) -> List[float]:
         """Get standard spacing options"""
@@ -162,37 +184,17 @@ class MaterialSystem:
         return {
             "lvl": self.get_lvl_materials(),
             "treated_pine": self.get_treated_pine_materials(),
-            "standard_lengths": self.standard_lengths,
+            "standard_lengths": list(self.standard_lengths),
             "standard_spacings": self.standard_spacings
         }
     
     def get_lvl_materials(self) -> List[Dict]:
         """Get LVL materials"""
-        return [
-            {
-                "specification": spec.specification_code,
-                "profile": spec.profile,
-                "grade": spec.grade.value,
-                "application": spec.application,
-                "load_capacity": spec.load_capacity
-            }
-            for spec in self.materials.values()
-            if spec.type == MaterialType.LVL
-        ]
+        return list(self._by_type[MaterialType.LVL])
     
     def get_treated_pine_materials(self) -> List[Dict]:
         """Get treated pine materials"""
-        return [
-            {
-                "specification": spec.specification_code,
-                "profile": spec.profile,
-                "grade": spec.grade.value,
-                "application": spec.application,
-                "load_capacity": spec.load_capacity
-            }
-            for spec in self.materials.values()
-            if spec.type == MaterialType.TREATED_PINE
-        ]
+        return list(self._by_type[MaterialType.TREATED_PINE])
     
     def get_steel_materials(self) -> List[Dict]:
         """Get steel materials - to be implemented"""
@@ -200,26 +202,31 @@ class MaterialSystem:
     
     def get_joist_materials(self) -> List[Dict]:
         """Get materials suitable for joists"""
-        return [
-            {
+        return list(self._joist_list)
+    
+    def _build_material_summaries(self) -> None:
+        """
+        Build the per-type material summaries returned by the getters above
+        The material table is fixed after __init__, so this runs once; the
+        summary dicts are shared between calls and should be treated as read-only
+        Summaries are bucketed by each spec's MaterialType, so no type
+        comparisons are made here or at query time
+        """
+        self._by_type: Dict[MaterialType, List[Dict]] = {material_type: [] for material_type in MaterialType}
+        self._joist_list = []
+        for spec in self.materials.values():
+            summary = {
                 "specification": spec.specification_code,
                 "profile": spec.profile,
                 "grade": spec.grade.value,
                 "application": spec.application,
-                "load_capacity": spec.load_capacity,
-                "max_span": self._calculate_max_span(spec)
+                "load_capacity": spec.load_capacity
             }
-            for spec in self.materials.values()
-            if spec.type == MaterialType.LVL and "joist" in spec.application.lower()
-        ]
+            self._by_type[spec.type].append(summary)
+            if spec.type is MaterialType.LVL and "joist" in spec.application.lower():
+                self._joist_list.append({**summary, "max_span": self._calculate_max_span(spec)})
     
     def _calculate_max_span(self, material: MaterialSpecification) -> float:
         """Calculate maximum span for a material (simplified)"""
         # This is a simplified calculation - would need proper engineering formulas
-        span_factors = {
-            "150x45": 3.0,
-            "200x45": 4.2,
-            "240x45": 6.0,
-            "200x63": 7.2
-        }
-        return span_factors.get(material.profile, 3.0)
\ No newline at end of file
+        return _SPAN_FACTORS.get(material.profile, 3.0)
\ No newline at end of file
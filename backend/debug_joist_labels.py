@@ -4,8 +4,37 @@ Debug joist label extraction
 """
 import pdfplumber
 import re
+from operator import itemgetter
 from pathlib import Path
 
+# Every joist label format (J1, J1A, RJ1, FJ1, 1J1) contains "J" followed by
+# a digit, so one search covers them all
+JOIST_LABEL_RE = re.compile(r'J\d')
+BUILDING_REF_RE = re.compile(r'\d+[A-Z]\d+')
+
+def _classify_words(words):
+    """
+    Pick out the words the report looks at, in one pass over the page.
+    
+    Returns:
+        (joist_words, building_refs, schedule_word) where the lists keep page
+        order and schedule_word is the first MEMBER/SCHEDULE word or None
+    """
+    joist_words, building_refs = [], []
+    schedule_word = None
+    for w in words:
+        text = w['text']
+        if JOIST_LABEL_RE.search(text):
+            joist_words.append(w)
+        if BUILDING_REF_RE.match(text):
+            building_refs.append(w)
+        if schedule_word is None:
+            upper = text.upper()
+            if 'MEMBER' in upper or 'SCHEDULE' in upper:
+                schedule_word = w
+    
+    return joist_words, building_refs, schedule_word
+
 def debug_joist_labels():
     """Debug joist label extraction"""
     
@@ -14,44 +43,22 @@ def debug_joist_labels():
     print(f"Looking for joist labels in: {pdf_path}")
     print("-" * 80)
     
-    # Patterns to look for
-    joist_patterns = [
-        r'(J\d+)([A-Z])?',  # J1, J1A
-        r'(RJ\d+)([A-Z])?',  # RJ1, RJ1A
-        r'(FJ\d+)([A-Z])?',  # FJ1, FJ1A
-        r'(\d+J\d+)',  # 1J1, 2J1 (alternative format)
-    ]
-    
     with pdfplumber.open(pdf_path) as pdf:
         for page_num, page in enumerate(pdf.pages):
             print(f"\n📄 PAGE {page_num}")
             
-            # Get all text
-            text = page.extract_text()
-            
-            # Get all words with positions
+            # Get all words with positions (the only extraction pass per page)
             words = page.extract_words()
             
+            joist_words, building_refs, schedule_word = _classify_words(words)
+            
             # Look for joist-related words
-            joist_words = []
-            for word in words:
-                word_text = word['text']
-                # Check if word matches any joist pattern
-                for pattern in joist_patterns:
-                    if re.match(pattern, word_text):
-                        joist_words.append(word)
-                        break
-                # Also check if it contains J followed by number
-                if re.search(r'J\d', word_text):
-                    if word not in joist_words:
-                        joist_words.append(word)
             
             print(f"\nFOUND {len(joist_words)} JOIST-RELATED WORDS:")
-            for w in sorted(joist_words, key=lambda x: x['text']):
+            for w in sorted(joist_words, key=itemgetter('text')):
                 print(f"  '{w['text']}' at position ({w['x0']:.1f}, {w['top']:.1f})")
             
             # Look for combinations like "1B13" which might be joists
-            building_refs = [w for w in words if re.match(r'\d+[A-Z]\d+', w['text'])]
             if building_refs:
                 print(f"\nBUILDING REFERENCES (might include joists):")
                 for w in building_refs[:20]:
@@ -59,18 +66,14 @@ def debug_joist_labels():
             
             # Check the member schedule area
             print(f"\nMEMBER SCHEDULE TEXT EXTRACTION:")
-            schedule_area_words = [
-                w for w in words
-                if 'MEMBER' in w['text'].upper() or 'SCHEDULE' in w['text'].upper()
-            ]
-            if schedule_area_words:
+            if schedule_word:
                 # Get words near "MEMBER SCHEDULE"
-                schedule_y = schedule_area_words[0]['top']
+                schedule_y = schedule_word['top']
                 nearby_words = [
                     w for w in words
                     if abs(w['top'] - schedule_y) < 200  # Within 200 pixels vertically
                 ]
-                schedule_text = ' '.join(w['text'] for w in sorted(nearby_words, key=lambda x: (x['top'], x['x0'])))
+                schedule_text = ' '.join(w['text'] for w in sorted(nearby_words, key=itemgetter('top', 'x0')))
                 print(f"  {schedule_text[:500]}...")
 
 if __name__ == "__main__":
@@ -5,6 +5,30 @@ Debug text extraction to see what pdfplumber is finding
 import pdfplumber
 from pathlib import Path
 
+def _classify_words(words, page_width, page_height):
+    """
+    Sort a page's words into the groups the debug report prints, in one pass.
+    
+    Returns:
+        (scale_words, title_block_words, potential_scales), each in page order
+    """
+    # Title block: bottom right area (typical title block location)
+    min_x0 = page_width * 0.6
+    min_top = page_height * 0.7
+    
+    scale_words, title_block_words, potential_scales = [], [], []
+    for w in words:
+        text = w['text']
+        if 'scale' in text.lower() or '1:' in text:
+            scale_words.append(w)
+        if w['x0'] > min_x0 and w['top'] > min_top:
+            title_block_words.append(w)
+        # Text containing numbers that might be a scale
+        if (':' in text or '1' in text) and any(c.isdigit() for c in text):
+            potential_scales.append(w)
+    
+    return scale_words, title_block_words, potential_scales
+
 def debug_text_extraction():
     """Debug what text is being extracted from the PDF"""
     
@@ -32,26 +56,23 @@ def debug_text_extraction():
             words = page.extract_words()
             print(f"\nWORD COUNT: {len(words)}")
             
+            scale_words, title_block_words, potential_scales = _classify_words(
+                words, page.width, page.height
+            )
+            
             # Look for scale-related words
-            scale_words = [w for w in words if 'scale' in w['text'].lower() or '1:' in w['text']]
             if scale_words:
                 print("\nSCALE-RELATED WORDS FOUND:")
                 for w in scale_words:
                     print(f"  '{w['text']}' at position ({w['x0']:.1f}, {w['top']:.1f})")
             
             # Look in bottom right area (typical title block location)
-            title_block_words = [
-                w for w in words
-                if w['x0'] > page.width * 0.6 and w['top'] > page.height * 0.7
-            ]
             if title_block_words:
                 print(f"\nTITLE BLOCK AREA TEXT ({len(title_block_words)} words):")
                 title_text = ' '.join(w['text'] for w in title_block_words[:50])
                 print(f"  {title_text}")
             
             # Look for any text containing numbers that might be scale
-            number_words = [w for w in words if any(c.isdigit() for c in w['text'])]
-            potential_scales = [w for w in number_words if ':' in w['text'] or '1' in w['text']]
             if potential_scales:
                 print(f"\nPOTENTIAL SCALE INDICATORS:")
                 for w in potential_scales[:10]:
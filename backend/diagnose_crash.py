@@ -8,24 +8,21 @@ import subprocess
 import signal
 import threading
 
-def monitor_process(pid):
-    """Monitor a process and report when it dies"""
-    print(f"Monitoring process {pid}...")
-    while True:
+def monitor_process(proc):
+    """Monitor a child process and report when it dies"""
+    print(f"Monitoring process {proc.pid}...")
+    # Blocks in the kernel until the child exits; no polling, and the exit is
+    # seen immediately (os.kill(pid, 0) keeps succeeding on an unreaped child)
+    returncode = proc.wait()
+    print(f"\n[MONITOR] Process {proc.pid} has died!")
+    if returncode < 0:
         try:
-            # Check if process exists
-            os.kill(pid, 0)
-            time.sleep(0.1)
-        except ProcessLookupError:
-            print(f"\n[MONITOR] Process {pid} has died!")
-            # Try to get exit status
-            try:
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-                if str(pid) not in result.stdout:
-                    print("[MONITOR] Process no longer in process list")
-            except:
-                pass
-            break
+            reason = signal.Signals(-returncode).name
+        except ValueError:
+            reason = f"signal {-returncode}"
+        print(f"[MONITOR] Killed by {reason}")
+    else:
+        print(f"[MONITOR] Exit code: {returncode}")
 
 def start_backend():
     """Start the backend with monitoring"""
@@ -47,7 +44,7 @@ def start_backend():
     proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
     
     # Start monitoring thread
-    monitor_thread = threading.Thread(target=monitor_process, args=(proc.pid,))
+    monitor_thread = threading.Thread(target=monitor_process, args=(proc,))
     monitor_thread.daemon = True
     monitor_thread.start()
     
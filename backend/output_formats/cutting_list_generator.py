@@ -1,9 +1,30 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 import json
+from collections import defaultdict
+from functools import lru_cache
 
-@dataclass
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Aligned cutting list row and table header for export_to_text, bound and built once at import
+_ROW_FORMAT = "{:<20} {:<5} {:<10} {:<15} {:<20} {:<10}".format
+_TABLE_HEADER = _ROW_FORMAT('Profile/Size', 'Qty', 'Length', 'Reference', 'Application', 'Waste')
+
+# Stock lengths repeat heavily across a cutting list, so their labels are cached
+@lru_cache(maxsize=1024)
+def _format_length(length: float) -> str:
+    return f"{length:.1f}m"
+
+@lru_cache(maxsize=1024)
+def _format_waste(waste: float) -> str:
+    return f"{waste:.2f}m" if waste > 0 else "0.00m"
+
+@dataclass(slots=True, frozen=True)
 class ProjectInfo:
     project_name: str
     client_name: str
@@ -12,7 +33,7 @@ class ProjectInfo:
     revision: str = "A"
     delivery_number: int = 1
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CuttingListItem:
     profile_size: str
     quantity: int
@@ -42,20 +63,20 @@ class CuttingListGenerator:
         Based on the examples: organized by material type with proper headers
         """
         
-        # Group items by material type
-        grouped_items = self._group_by_material_type(cutting_items)
-        
         # Generate header
         header = self._generate_header(project_info)
         
+        # One pass over the items builds every section and the summary totals
+        sections, totals = self._accumulate_sections(cutting_items)
+        
         # Generate material sections
-        material_sections = []
-        for material_type, items in grouped_items.items():
-            section = self._generate_material_section(material_type, items)
-            material_sections.append(section)
+        material_sections = [
+            self._generate_material_section(material_type, *accumulated)
+            for material_type, accumulated in sections.items()
+        ]
         
         # Generate summary
-        summary = self._generate_summary(cutting_items)
+        summary = self._generate_summary(totals, sections)
         
         cutting_list = {
             "header": header,
@@ -80,41 +101,53 @@ class CuttingListGenerator:
             "subtitle": f"Delivery {project_info.delivery_number}"
         }
     
-    def _group_by_material_type(self, items: List[CuttingListItem]) -> Dict:
-        """Group cutting list items by material type"""
-        grouped = {}
-        
-        for item in items:
-            material_category = self._get_material_category(item.material_type)
-            if material_category not in grouped:
-                grouped[material_category] = []
-            grouped[material_category].append(item)
+    def _accumulate_sections(self, items: List[CuttingListItem]) -> Tuple[Dict[str, list], Tuple[int, float, float]]:
+        """
+        Group items by material category and total them in a single pass
         
-        return grouped
-    
-    def _get_material_category(self, material_type: str) -> str:
-        """Get material category for grouping"""
-        return self.material_categories.get(material_type, "Other Materials")
-    
-    def _generate_material_section(self, material_type: str, items: List[CuttingListItem]) -> Dict:
-        """Generate a material section matching client format"""
+        Returns:
+            Dict of category -> [formatted items, pieces, length, waste], in
+            order of first appearance, and the (pieces, length, waste) totals
+            over all items
+        """
+        category_of = self.material_categories.get
+        sections = defaultdict(lambda: [[], 0, 0.0, 0.0])
+        total_pieces = total_length = total_waste = 0
         
-        section_items = []
         for item in items:
-            section_items.append({
+            accumulated = sections[category_of(item.material_type, "Other Materials")]
+            accumulated[0].append({
                 "profile_size": item.profile_size,
                 "quantity": item.quantity,
-                "length": f"{item.length:.1f}m",
+                "length": _format_length(item.length),
                 "reference": item.reference,
                 "application": item.application,
-                "waste": f"{item.waste:.2f}m" if item.waste > 0 else "0.00m"
+                "waste": _format_waste(item.waste)
             })
+            length = item.quantity * item.length
+            waste = item.waste * item.quantity
+            accumulated[1] += item.quantity
+            accumulated[2] += length
+            accumulated[3] += waste
+            total_pieces += item.quantity
+            total_length += length
+            total_waste += waste
         
-        # Calculate section totals
-        total_pieces = sum(item.quantity for item in items)
-        total_length = sum(item.quantity * item.length for item in items)
-        total_waste = sum(item.waste * item.quantity for item in items)
-        
+        return sections, (total_pieces, total_length, total_waste)
+    
+    def _get_material_category(self, material_type: str) -> str:
+        """Get material category for grouping"""
+        return self.material_categories.get(material_type, "Other Materials")
+    
+    def _generate_material_section(
+        self,
+        material_type: str,
+        section_items: List[Dict],
+        total_pieces: int,
+        total_length: float,
+        total_waste: float
+    ) -> Dict:
+        """Generate a material section matching client format"""
         return {
             "material_type": material_type,
             "items": section_items,
@@ -126,26 +159,14 @@ class CuttingListGenerator:
             }
         }
     
-    def _generate_summary(self, items: List[CuttingListItem]) -> Dict:
-        """Generate overall summary"""
-        total_pieces = sum(item.quantity for item in items)
-        total_length = sum(item.quantity * item.length for item in items)
-        total_waste = sum(item.waste * item.quantity for item in items)
-        
-        # Group by material type for summary
-        material_totals = {}
-        for item in items:
-            material_category = self._get_material_category(item.material_type)
-            if material_category not in material_totals:
-                material_totals[material_category] = {
-                    "pieces": 0,
-                    "length": 0.0,
-                    "waste": 0.0
-                }
-            
-            material_totals[material_category]["pieces"] += item.quantity
-            material_totals[material_category]["length"] += item.quantity * item.length
-            material_totals[material_category]["waste"] += item.waste * item.quantity
+    def _generate_summary(self, totals: Tuple[int, float, float], sections: Dict[str, list]) -> Dict:
+        """Generate overall summary from the totals gathered by _accumulate_sections"""
+        total_pieces, total_length, total_waste = totals
+        
+        material_totals = {
+            material_category: {"pieces": pieces, "length": length, "waste": waste}
+            for material_category, (_, pieces, length, waste) in sections.items()
+        }
         
         return {
             "total_pieces": total_pieces,
@@ -176,14 +197,16 @@ class CuttingListGenerator:
         for section in cutting_list["material_sections"]:
             text_output.append(f"{section['material_type']}")
             text_output.append("-" * 80)
-            text_output.append(f"{'Profile/Size':<20} {'Qty':<5} {'Length':<10} {'Reference':<15} {'Application':<20} {'Waste':<10}")
+            text_output.append(_TABLE_HEADER)
             text_output.append("-" * 80)
             
-            for item in section["items"]:
-                text_output.append(
-                    f"{item['profile_size']:<20} {item['quantity']:<5} {item['length']:<10} "
-                    f"{item['reference']:<15} {item['application']:<20} {item['waste']:<10}"
+            text_output.extend([
+                _ROW_FORMAT(
+                    item['profile_size'], item['quantity'], item['length'],
+                    item['reference'], item['application'], item['waste']
                 )
+                for item in section["items"]
+            ])
             
             text_output.append("-" * 80)
             totals = section["totals"]
@@ -214,6 +237,9 @@ class CuttingListGenerator:
     
     def export_to_json(self, cutting_list: Dict) -> str:
         """Export cutting list to JSON format"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(cutting_list, option=orjson.OPT_INDENT_2).decode()
+        
         return json.dumps(cutting_list, indent=2)
     
     def create_joist_cutting_list(
@@ -1,5 +1,6 @@
 import re
 import numpy as np
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from .advanced_pdf_analyzer import AdvancedPDFAnalyzer, ExtractedText, DetectedLine, StructuralElement
@@ -7,6 +8,49 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Joist labels as one case-insensitive alternation, so each text item is scanned
+# once: J1, JOIST 1, J-1 and J 1 (and their lower/title-case spellings)
+JOIST_LABEL_PATTERN = re.compile(r'\b(J\d+|JOIST\s*\d+|J-\d+|J\s+\d+)\b', re.IGNORECASE)
+
+# Enhanced specification patterns; _parse_specification_advanced depends on this order.
+# Alternatives that differed only by case (LVL|lvl, CRS|crs, ...) are folded away
+SPECIFICATION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Full specifications with dimensions, material, and spacing
+    r'(\d+)\s*[x×*]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|PINE)\s*(?:timber\s*)?(?:beams?\s*)?(?:at|@|spacing|centres?|centers?)\s*(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|CRS)',
+    
+    # Specifications with "at" or "@"
+    r'(\d+)\s*[x×*/]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|PINE)\s*(?:timber\s*)?(?:beams?\s*)?(?:at|@)\s*(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|CRS)',
+    
+    # Specifications without "at" (implied spacing)
+    r'(\d+)\s*[x×*]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|PINE)\s*(?:timber\s*)?(?:beams?\s*)?\s*(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|CRS)',
+    
+    # Just dimensions and material
+    r'(\d+)\s*[x×*]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|PINE)',
+    
+    # Just spacing information
+    r'(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|CRS|spacing)',
+    
+    # Alternative formats
+    r'(\d+)\s*mm\s*[x×*]\s*(\d+)\s*mm\s*(LVL|MGP\d*|F\d*)',
+    
+    # Spacing with "o.c." (on center)
+    r'(\d+)\s*(?:mm)?\s*(?:o\.c\.|OC|o/c)',
+))
+
+# Whether text contains any specification at all, in a single search
+SPECIFICATION_MATCHER = re.compile(
+    '|'.join(f'(?:{pattern.pattern})' for pattern in SPECIFICATION_PATTERNS), re.IGNORECASE
+)
+
+# Measurement text (2.4m, 3600mm, 12cm, 8ft) for _find_measurements_near_joist,
+# with the units as one alternation so each text item is searched once
+MEASUREMENT_PATTERN = re.compile(r'\d+\.?\d*\s*(?:mm|cm|ft|m)\b', re.IGNORECASE)
+
+_DIGITS_RE = re.compile(r'\d+')
+
+# Detections closer than this (px, same page) with matching label numbers are duplicates
+DEDUP_DISTANCE = 50
+
 @dataclass
 class AdvancedJoistLabel:
     label: str
@@ -18,6 +62,14 @@ class AdvancedJoistLabel:
     detection_methods: List[str]  # Which methods found this joist
     spatial_elements: Dict  # Related lines, measurements, etc.
 
+@dataclass
+class SpatialIndex:
+    """Centers and pages of text items or lines as parallel arrays for radius queries"""
+    cx: np.ndarray
+    cy: np.ndarray
+    page: np.ndarray
+    items: List  # ExtractedText or DetectedLine, in the order of the arrays
+
 @dataclass
 class JoistSpecification:
     width_mm: Optional[float] = None
@@ -32,41 +84,8 @@ class AdvancedJoistDetector:
     def __init__(self):
         self.pdf_analyzer = AdvancedPDFAnalyzer()
         
-        # Enhanced joist label patterns
-        self.joist_label_patterns = [
-            r'\b(J\d+)\b',  # J1, J2, J3
-            r'\b(j\d+)\b',  # j1, j2, j3
-            r'\b(JOIST\s*\d+)\b',  # JOIST 1, JOIST 2
-            r'\b(joist\s*\d+)\b',  # joist 1, joist 2
-            r'\b(Joist\s*\d+)\b',  # Joist 1, Joist 2
-            r'\b(J-\d+)\b',  # J-1, J-2
-            r'\b(j-\d+)\b',  # j-1, j-2
-            r'\b(J\s+\d+)\b',  # J 1, J 2
-        ]
-        
-        # Enhanced specification patterns
-        self.specification_patterns = [
-            # Full specifications with dimensions, material, and spacing
-            r'(\d+)\s*[x×*]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|lvl|mgp\d*|f\d*|PINE|pine|Pine)\s*(?:timber\s*)?(?:beams?\s*)?(?:at|@|AT|spacing|SPACING|centres?|centers?|CENTRES?)\s*(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|C|CENTRES?|CRS|crs)',
-            
-            # Specifications with "at" or "@"
-            r'(\d+)\s*[x×*/]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|lvl|mgp\d*|f\d*|PINE|pine|Pine)\s*(?:timber\s*)?(?:beams?\s*)?(?:at|@|AT)\s*(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|C|CENTRES?|CRS|crs)',
-            
-            # Specifications without "at" (implied spacing)
-            r'(\d+)\s*[x×*]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|lvl|mgp\d*|f\d*|PINE|pine|Pine)\s*(?:timber\s*)?(?:beams?\s*)?\s*(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|C|CENTRES?|CRS|crs)',
-            
-            # Just dimensions and material
-            r'(\d+)\s*[x×*]\s*(\d+)\s*(?:mm)?\s*(LVL|MGP\d*|F\d*|lvl|mgp\d*|f\d*|PINE|pine|Pine)',
-            
-            # Just spacing information
-            r'(\d+)\s*(?:mm)?\s*(?:centres?|centers?|c|C|CENTRES?|CRS|crs|spacing|SPACING)',
-            
-            # Alternative formats
-            r'(\d+)\s*mm\s*[x×*]\s*(\d+)\s*mm\s*(LVL|MGP\d*|F\d*|lvl|mgp\d*|f\d*)',
-            
-            # Spacing with "o.c." (on center)
-            r'(\d+)\s*(?:mm)?\s*(?:o\.c\.|OC|o/c|O/C)',
-        ]
+        # Patterns are compiled once at import (see the module-level tables)
+        self.specification_patterns = SPECIFICATION_PATTERNS
         
         # Material mappings
         self.material_mappings = {
@@ -116,15 +135,16 @@ class AdvancedJoistDetector:
                                  structural_elements: List[StructuralElement]) -> List[AdvancedJoistLabel]:
         """Extract joist information from multiple data sources"""
         joist_labels = []
+        text_index = self._build_text_index(extracted_text)
         
         # Method 1: Text-based detection
-        text_based_joists = self._detect_joists_from_text(extracted_text)
+        text_based_joists = self._detect_joists_from_text(text_index)
         
         # Method 2: Structural element analysis
         element_based_joists = self._detect_joists_from_elements(structural_elements)
         
         # Method 3: Line pattern analysis
-        line_based_joists = self._detect_joists_from_lines(detected_lines, extracted_text)
+        line_based_joists = self._detect_joists_from_lines(detected_lines, text_index)
         
         # Combine and deduplicate
         all_joists = text_based_joists + element_based_joists + line_based_joists
@@ -132,34 +152,35 @@ class AdvancedJoistDetector:
         
         return deduplicated_joists
     
-    def _detect_joists_from_text(self, extracted_text: List[ExtractedText]) -> List[AdvancedJoistLabel]:
+    def _detect_joists_from_text(self, text_index: SpatialIndex) -> List[AdvancedJoistLabel]:
         """Detect joists from text using pattern matching"""
         joists = []
         
-        for text_item in extracted_text:
+        for text_item in text_index.items:
             # Look for joist labels
-            for pattern in self.joist_label_patterns:
-                matches = re.findall(pattern, text_item.text, re.IGNORECASE)
-                
-                for match in matches:
-                    # Look for specifications nearby
-                    spec_text, spec_confidence = self._find_nearby_specification(
-                        text_item.text, extracted_text, text_item
-                    )
-                    
-                    if spec_text:
-                        parsed_spec = self._parse_specification_advanced(spec_text)
-                        
-                        joists.append(AdvancedJoistLabel(
-                            label=match.upper(),
-                            specification=spec_text,
-                            dimensions=parsed_spec,
-                            bbox=text_item.bbox,
-                            page_number=text_item.page_number,
-                            confidence=min(text_item.confidence, spec_confidence),
-                            detection_methods=["text_pattern"],
-                            spatial_elements={}
-                        ))
+            matches = JOIST_LABEL_PATTERN.findall(text_item.text)
+            if not matches:
+                continue
+            
+            # Look for specifications nearby; the result depends only on the text item,
+            # so it is shared by every label found in it
+            spec_text, spec_confidence = self._find_nearby_specification(
+                text_item.text, text_index, text_item
+            )
+            if not spec_text:
+                continue
+            
+            for match in matches:
+                joists.append(AdvancedJoistLabel(
+                    label=match.upper(),
+                    specification=spec_text,
+                    dimensions=self._parse_specification_advanced(spec_text),
+                    bbox=text_item.bbox,
+                    page_number=text_item.page_number,
+                    confidence=min(text_item.confidence, spec_confidence),
+                    detection_methods=["text_pattern"],
+                    spatial_elements={}
+                ))
         
         return joists
     
@@ -200,7 +221,7 @@ class AdvancedJoistDetector:
         return joists
     
     def _detect_joists_from_lines(self, detected_lines: List[DetectedLine], 
-                                extracted_text: List[ExtractedText]) -> List[AdvancedJoistLabel]:
+                                text_index: SpatialIndex) -> List[AdvancedJoistLabel]:
         """Detect joists by analyzing line patterns and nearby text"""
         joists = []
         
@@ -220,18 +241,17 @@ class AdvancedJoistDetector:
                     
                     # Look for nearby text that might describe these joists
                     cluster_bbox = self._get_cluster_bbox(cluster)
-                    nearby_text = self._find_text_near_bbox(cluster_bbox, extracted_text, radius=100)
+                    nearby_text = self._find_text_near_bbox(cluster_bbox, text_index, radius=100)
                     
                     # Try to find joist specifications in nearby text
                     best_spec = ""
                     best_confidence = 0.5
                     
                     for text_item in nearby_text:
-                        for pattern in self.specification_patterns:
-                            if re.search(pattern, text_item.text, re.IGNORECASE):
-                                if text_item.confidence > best_confidence:
-                                    best_spec = text_item.text
-                                    best_confidence = text_item.confidence
+                        if SPECIFICATION_MATCHER.search(text_item.text):
+                            if text_item.confidence > best_confidence:
+                                best_spec = text_item.text
+                                best_confidence = text_item.confidence
                     
                     parsed_spec = self._parse_specification_advanced(best_spec) if best_spec else {}
                     
@@ -248,37 +268,34 @@ class AdvancedJoistDetector:
         
         return joists
     
-    def _find_nearby_specification(self, current_text: str, all_text: List[ExtractedText], 
+    def _find_nearby_specification(self, current_text: str, text_index: SpatialIndex, 
                                  current_item: ExtractedText, radius: float = 150) -> Tuple[str, float]:
         """Find joist specification text near a joist label"""
         best_spec = ""
         best_confidence = 0.0
         
         # First, check if specification is in the same text block
-        for pattern in self.specification_patterns:
-            match = re.search(pattern, current_text, re.IGNORECASE)
-            if match:
-                return current_text, current_item.confidence
+        if SPECIFICATION_MATCHER.search(current_text):
+            return current_text, current_item.confidence
         
         # Look in nearby text blocks
-        current_center = self._get_bbox_center(current_item.bbox)
+        distances = self._distances_from(text_index, self._get_bbox_center(current_item.bbox))
+        in_range = (text_index.page == current_item.page_number) & (distances <= radius)
         
-        for text_item in all_text:
-            if text_item == current_item or text_item.page_number != current_item.page_number:
+        for i in np.flatnonzero(in_range):
+            text_item = text_index.items[i]
+            if text_item == current_item:
                 continue
             
-            distance = self._calculate_distance(current_center, self._get_bbox_center(text_item.bbox))
-            
-            if distance <= radius:
-                for pattern in self.specification_patterns:
-                    if re.search(pattern, text_item.text, re.IGNORECASE):
-                        # Calculate confidence based on distance and text confidence
-                        spatial_confidence = max(0.1, 1.0 - (distance / radius))
-                        combined_confidence = text_item.confidence * spatial_confidence
-                        
-                        if combined_confidence > best_confidence:
-                            best_spec = text_item.text
-                            best_confidence = combined_confidence
+            if SPECIFICATION_MATCHER.search(text_item.text):
+                distance = float(distances[i])
+                # Calculate confidence based on distance and text confidence
+                spatial_confidence = max(0.1, 1.0 - (distance / radius))
+                combined_confidence = text_item.confidence * spatial_confidence
+                
+                if combined_confidence > best_confidence:
+                    best_spec = text_item.text
+                    best_confidence = combined_confidence
         
         return best_spec, best_confidence
     
@@ -290,7 +307,7 @@ class AdvancedJoistDetector:
         result = {}
         
         for i, pattern in enumerate(self.specification_patterns):
-            match = re.search(pattern, spec_text, re.IGNORECASE)
+            match = pattern.search(spec_text)
             
             if match:
                 groups = match.groups()
@@ -339,12 +356,14 @@ class AdvancedJoistDetector:
                                      analysis_result: Dict) -> List[AdvancedJoistLabel]:
         """Enhance joist detection with spatial relationship analysis"""
         enhanced_joists = []
+        text_index = self._build_text_index(analysis_result["extracted_text"])
+        line_index = self._build_line_index(analysis_result["detected_lines"])
         
         for joist in joist_labels:
             enhanced_joist = joist
             
             # Try to find related lines near this joist label
-            nearby_lines = self._find_lines_near_joist(joist, analysis_result["detected_lines"])
+            nearby_lines = self._find_lines_near_joist(joist, line_index)
             if nearby_lines:
                 enhanced_joist.spatial_elements["nearby_lines"] = nearby_lines
                 
@@ -356,7 +375,7 @@ class AdvancedJoistDetector:
                         enhanced_joist.spatial_elements["visual_spacing_px"] = avg_spacing_px
             
             # Try to find related measurements
-            nearby_measurements = self._find_measurements_near_joist(joist, analysis_result["extracted_text"])
+            nearby_measurements = self._find_measurements_near_joist(joist, text_index)
             if nearby_measurements:
                 enhanced_joist.spatial_elements["nearby_measurements"] = nearby_measurements
             
@@ -369,42 +388,76 @@ class AdvancedJoistDetector:
         if not joists:
             return []
         
-        # Group joists by proximity and label similarity
-        unique_joists = []
+        # Kept detections in order; a slot is cleared when a better detection replaces
+        # it, and the replacement takes a new slot at the end
+        unique_joists: List[Optional[AdvancedJoistLabel]] = []
+        
+        # Slots bucketed by (page, grid x, grid y) with DEDUP_DISTANCE cells, so a
+        # duplicate can only sit in the 3x3 block of cells around a center
+        buckets: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+        limit = DEDUP_DISTANCE * DEDUP_DISTANCE
         
         for joist in joists:
-            is_duplicate = False
+            cx, cy = self._get_bbox_center(joist.bbox)
+            gx, gy = int(cx // DEDUP_DISTANCE), int(cy // DEDUP_DISTANCE)
             
-            for existing in unique_joists:
-                # Check if they're the same joist (similar location and label)
-                if (existing.page_number == joist.page_number and
-                    self._calculate_distance(
-                        self._get_bbox_center(existing.bbox),
-                        self._get_bbox_center(joist.bbox)
-                    ) < 50 and
-                    self._similar_labels(existing.label, joist.label)):
-                    
-                    # Merge the better detection
-                    if joist.confidence > existing.confidence:
-                        # Replace with better detection
-                        unique_joists.remove(existing)
-                        unique_joists.append(joist)
-                    is_duplicate = True
-                    break
+            # Check if it's the same joist as an earlier one (similar location and label);
+            # the earliest kept slot wins, as in a front-to-back scan
+            match = None
+            for nx in (gx - 1, gx, gx + 1):
+                for ny in (gy - 1, gy, gy + 1):
+                    for slot in buckets.get((joist.page_number, nx, ny), ()):
+                        existing = unique_joists[slot]
+                        if existing is None or (match is not None and slot > match):
+                            continue
+                        ex, ey = self._get_bbox_center(existing.bbox)
+                        if ((ex - cx)**2 + (ey - cy)**2 < limit and
+                            self._similar_labels(existing.label, joist.label)):
+                            match = slot
             
-            if not is_duplicate:
-                unique_joists.append(joist)
+            if match is not None:
+                # Merge the better detection
+                if joist.confidence <= unique_joists[match].confidence:
+                    continue
+                unique_joists[match] = None
+            
+            buckets[(joist.page_number, gx, gy)].append(len(unique_joists))
+            unique_joists.append(joist)
         
-        return unique_joists
+        return [joist for joist in unique_joists if joist is not None]
     
     # Utility methods
     def _get_bbox_center(self, bbox: Tuple[float, float, float, float]) -> Tuple[float, float]:
         """Calculate center point of bounding box"""
         return ((bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2)
     
-    def _calculate_distance(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
-        """Calculate Euclidean distance between two points"""
-        return np.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
+    def _build_text_index(self, text_items: List[ExtractedText]) -> SpatialIndex:
+        """Index text items by bbox center so radius queries are one array pass"""
+        return SpatialIndex(
+            cx=np.array([(item.bbox[0] + item.bbox[2]) / 2 for item in text_items], dtype=np.float64),
+            cy=np.array([(item.bbox[1] + item.bbox[3]) / 2 for item in text_items], dtype=np.float64),
+            page=np.array([item.page_number for item in text_items], dtype=np.int64),
+            items=text_items
+        )
+    
+    def _build_line_index(self, lines: List[DetectedLine]) -> SpatialIndex:
+        """Index lines by midpoint so radius queries are one array pass"""
+        return SpatialIndex(
+            cx=np.array([(line.start_point[0] + line.end_point[0]) / 2 for line in lines], dtype=np.float64),
+            cy=np.array([(line.start_point[1] + line.end_point[1]) / 2 for line in lines], dtype=np.float64),
+            page=np.array([line.page_number for line in lines], dtype=np.int64),
+            items=lines
+        )
+    
+    def _squared_distances_from(self, index: SpatialIndex, point: Tuple[float, float]) -> np.ndarray:
+        """Squared distance from point to every indexed center"""
+        dx = index.cx - point[0]
+        dy = index.cy - point[1]
+        return dx * dx + dy * dy
+    
+    def _distances_from(self, index: SpatialIndex, point: Tuple[float, float]) -> np.ndarray:
+        """Euclidean distance from point to every indexed center"""
+        return np.sqrt(self._squared_distances_from(index, point))
     
     def _cluster_lines_by_proximity(self, lines: List[DetectedLine], max_distance: float = 50.0) -> List[List[DetectedLine]]:
         """Cluster lines by proximity"""
@@ -458,72 +511,33 @@ class AdvancedJoistDetector:
         return (min(all_x), min(all_y), max(all_x), max(all_y))
     
     def _find_text_near_bbox(self, bbox: Tuple[float, float, float, float], 
-                           text_items: List[ExtractedText], radius: float = 100) -> List[ExtractedText]:
+                           text_index: SpatialIndex, radius: float = 100) -> List[ExtractedText]:
         """Find text items near a bounding box"""
-        bbox_center = self._get_bbox_center(bbox)
-        nearby_text = []
-        
-        for text_item in text_items:
-            text_center = self._get_bbox_center(text_item.bbox)
-            distance = self._calculate_distance(bbox_center, text_center)
-            
-            if distance <= radius:
-                nearby_text.append(text_item)
-        
-        return nearby_text
+        in_range = self._squared_distances_from(text_index, self._get_bbox_center(bbox)) <= radius * radius
+        return [text_index.items[i] for i in np.flatnonzero(in_range)]
     
     def _find_lines_near_joist(self, joist: AdvancedJoistLabel, 
-                             detected_lines: List[DetectedLine], radius: float = 200) -> List[DetectedLine]:
+                             line_index: SpatialIndex, radius: float = 200) -> List[DetectedLine]:
         """Find lines near a joist label"""
-        joist_center = self._get_bbox_center(joist.bbox)
-        nearby_lines = []
-        
-        for line in detected_lines:
-            if line.page_number != joist.page_number:
-                continue
-            
-            line_center = ((line.start_point[0] + line.end_point[0])/2, 
-                          (line.start_point[1] + line.end_point[1])/2)
-            distance = self._calculate_distance(joist_center, line_center)
-            
-            if distance <= radius:
-                nearby_lines.append(line)
-        
-        return nearby_lines
+        in_range = ((line_index.page == joist.page_number) &
+                    (self._squared_distances_from(line_index, self._get_bbox_center(joist.bbox)) <= radius * radius))
+        return [line_index.items[i] for i in np.flatnonzero(in_range)]
     
     def _find_measurements_near_joist(self, joist: AdvancedJoistLabel, 
-                                    extracted_text: List[ExtractedText], radius: float = 150) -> List[ExtractedText]:
+                                    text_index: SpatialIndex, radius: float = 150) -> List[ExtractedText]:
         """Find measurement text near a joist"""
-        joist_center = self._get_bbox_center(joist.bbox)
-        measurement_patterns = [
-            r'\d+\.?\d*\s*m\b',
-            r'\d+\.?\d*\s*mm\b',
-            r'\d+\.?\d*\s*cm\b',
-            r'\d+\.?\d*\s*ft\b'
-        ]
-        
-        nearby_measurements = []
-        
-        for text_item in extracted_text:
-            if text_item.page_number != joist.page_number:
-                continue
-            
-            text_center = self._get_bbox_center(text_item.bbox)
-            distance = self._calculate_distance(joist_center, text_center)
-            
-            if distance <= radius:
-                for pattern in measurement_patterns:
-                    if re.search(pattern, text_item.text, re.IGNORECASE):
-                        nearby_measurements.append(text_item)
-                        break
+        in_range = ((text_index.page == joist.page_number) &
+                    (self._squared_distances_from(text_index, self._get_bbox_center(joist.bbox)) <= radius * radius))
         
-        return nearby_measurements
+        # Only the text within the radius is run through the measurement pattern
+        return [text_index.items[i] for i in np.flatnonzero(in_range)
+                if MEASUREMENT_PATTERN.search(text_index.items[i].text)]
     
     def _similar_labels(self, label1: str, label2: str) -> bool:
         """Check if two joist labels are similar"""
         # Extract numbers from labels
-        num1 = re.findall(r'\d+', label1)
-        num2 = re.findall(r'\d+', label2)
+        num1 = _DIGITS_RE.findall(label1)
+        num2 = _DIGITS_RE.findall(label2)
         
         if num1 and num2:
             return num1[0] == num2[0]
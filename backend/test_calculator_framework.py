@@ -13,11 +13,13 @@ This script tests the new modular calculator framework to ensure:
 
 import sys
 import os
+import math
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.calculators import (
     element_registry,
     create_calculator,
+    JoistCalculator,
     EnhancedJoistCalculator,
     JOIST_TYPES
 )
@@ -88,6 +90,94 @@ def test_joist_calculator():
     print(calc_j2.format_output(result))
 
 
+def test_exact_multiple_joist_counts():
+    """Spans that are an exact multiple of the spacing must not gain a joist."""
+    print("\n\n=== Testing Exact-Multiple Joist Counts ===")
+    
+    # 2.1 / 0.3 is 7.000000000000001 in floating point, which used to round up to 8
+    calc = JoistCalculator()
+    cases = [(2.1, 0.3, 7), (5.4, 0.3, 18), (4.2, 0.6, 7), (2.2, 0.3, 8)]
+    for span, spacing, expected in cases:
+        joist_count = calc.calculate_joists(span, spacing, "L1")["joist_count"]
+        assert joist_count == expected, f"{span}m at {spacing}m: expected {expected} joists, got {joist_count}"
+        print(f"✓ {span}m at {spacing}m centres → {joist_count} joists")
+    
+    # Both calculators must agree on the same input (J2 is at 0.3m centres)
+    enhanced = EnhancedJoistCalculator('J2')
+    result = enhanced.calculate(dimensions={'width': 2.1, 'length': 4.2})
+    joist_count = calc.calculate_joists(2.1, 0.3, "L1")["joist_count"]
+    assert result['number_of_joists'] == joist_count, (
+        f"EnhancedJoistCalculator gives {result['number_of_joists']}, JoistCalculator gives {joist_count}"
+    )
+    print(f"✓ EnhancedJoistCalculator and JoistCalculator agree: {joist_count} joists")
+    
+    # A positive spacing under half a millimetre rounds to 0mm; reject it rather than divide by zero
+    try:
+        calc.calculate_joists(2.1, 0.0004, "L1")
+    except ValueError as e:
+        print(f"✓ calculate_joists rejects a 0.0004m spacing: {e}")
+    else:
+        raise AssertionError("calculate_joists accepted a 0.0004m spacing")
+
+
+def _greedy_blocking_pieces(total_length, standard_lengths):
+    """The longest-first blocking layout JoistCalculator used before the DP, as (quantity, length) pairs."""
+    pieces = []
+    remaining_length = total_length
+    for standard_length in sorted(standard_lengths, reverse=True):
+        if remaining_length <= 0:
+            break
+        quantity_needed = int(remaining_length / standard_length)
+        if quantity_needed > 0:
+            pieces.append((quantity_needed, standard_length))
+            remaining_length -= quantity_needed * standard_length
+    if remaining_length > 0:
+        fits = [length for length in sorted(standard_lengths) if length >= remaining_length]
+        pieces.append((1, fits[0] if fits else max(standard_lengths)))
+    return pieces
+
+
+def test_blocking_length_optimizer():
+    """Check the least-offcut blocking layout from JoistCalculator._optimize_total_length."""
+    print("\n\n=== Testing Blocking Length Optimizer ===")
+    
+    calc = JoistCalculator()
+    
+    def ordered_length(pieces):
+        return sum(quantity * length for quantity, length, *_ in pieces)
+    
+    def check_layout(total):
+        pieces = calc._optimize_total_length(total)
+        ordered = ordered_length(pieces)
+        used = sum(quantity * cut_length for quantity, _, cut_length, _ in pieces)
+        assert all(length in calc.standard_lengths for _, length, _, _ in pieces), f"{total}m: non-standard board in {pieces}"
+        assert ordered >= total - 1e-9, f"{total}m: boards only cover {ordered:.3f}m"
+        assert abs(used - total) < 1e-6, f"{total}m: cut lengths add up to {used:.3f}m"
+        return pieces, ordered
+    
+    # A total made of whole boards leaves no offcut
+    for total in (7.2, 9.0, 14.4):
+        pieces, ordered = check_layout(total)
+        assert abs(ordered - total) < 1e-9, f"{total}m: expected no offcut, ordered {ordered:.3f}m"
+        print(f"✓ {total}m → {pieces} with no offcut")
+    
+    # Beyond the 100m exact window the longest boards are pre-filled. Standard boards
+    # combine into every multiple of 0.6m from 3.0m up, so the best layout orders
+    # the next multiple of 0.6m
+    for total in (123.45, 250.0):
+        pieces, ordered = check_layout(total)
+        best = math.ceil(round(total / 0.6, 6)) * 0.6
+        assert abs(ordered - best) < 1e-6, f"{total}m: ordered {ordered:.3f}m, best is {best:.1f}m"
+        print(f"✓ {total}m → {ordered:.1f}m ordered ({ordered - total:.2f}m offcut)")
+    
+    # Never orders more timber than the old longest-first layout
+    for total in (6.772, 9.6, 12.3, 20.0, 33.87):
+        pieces, ordered = check_layout(total)
+        greedy = ordered_length(_greedy_blocking_pieces(total, calc.standard_lengths))
+        assert ordered <= greedy + 1e-9, f"{total}m: ordered {ordered:.1f}m, longest-first ordered {greedy:.1f}m"
+        print(f"✓ {total}m → {ordered:.1f}m ordered (longest-first: {greedy:.1f}m)")
+
+
 def test_generic_calculator():
     """Test generic calculator with non-joist types."""
     print("\n\n=== Testing Generic Calculator ===")
@@ -179,6 +269,8 @@ def main():
     try:
         test_element_registry()
         test_joist_calculator()
+        test_exact_multiple_joist_counts()
+        test_blocking_length_optimizer()
         test_generic_calculator()
         test_calculator_factory()
         test_api_simulation()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for the joist calculation agent's enhancement sections
+
+Checks that a joist_calculation task can ask for all, some or one of the
+enhancement sections, and that malformed requests are rejected clearly.
+"""
+
+import asyncio
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.agents.specialized.joist_calculation_agent import JoistCalculationAgent
+
+ALL_SECTIONS = {"material_efficiency", "cost_estimation", "delivery_optimization", "environmental_impact"}
+
+
+def run_joist_task(agent, **extra_input):
+    """Run a joist_calculation task for a 3.386m span at 450mm centres"""
+    task = {
+        "type": "joist_calculation",
+        "input": {"span_length": 3.386, "joist_spacing": 0.45, **extra_input}
+    }
+    return asyncio.run(agent.execute_task(task))["calculation_result"]
+
+
+def sections_in(result):
+    return ALL_SECTIONS & result.keys()
+
+
+def test_enhancement_sections():
+    """Default, list subset and single-name requests produce the expected sections."""
+    print("\n=== Testing Enhancement Sections ===")
+    
+    agent = JoistCalculationAgent()
+    
+    result = run_joist_task(agent)
+    assert sections_in(result) == ALL_SECTIONS, f"default: got {sorted(sections_in(result))}"
+    print("✓ No enhancements given → all four sections")
+    
+    result = run_joist_task(agent, enhancements=["cost_estimation", "material_efficiency"])
+    assert sections_in(result) == {"cost_estimation", "material_efficiency"}, f"subset: got {sorted(sections_in(result))}"
+    assert result["cost_estimation"]["currency"] == "AUD"
+    print("✓ List of two sections → only those two")
+    
+    result = run_joist_task(agent, enhancements="cost_estimation")
+    assert sections_in(result) == {"cost_estimation"}, f"single name: got {sorted(sections_in(result))}"
+    print("✓ Single section name → that section only")
+
+
+def test_invalid_enhancements():
+    """Unknown names and non-list values raise ValueError."""
+    print("\n=== Testing Invalid Enhancement Requests ===")
+    
+    agent = JoistCalculationAgent()
+    
+    for enhancements in (["cost"], 5):
+        try:
+            run_joist_task(agent, enhancements=enhancements)
+        except ValueError as e:
+            print(f"✓ enhancements={enhancements!r} rejected: {e}")
+        else:
+            raise AssertionError(f"enhancements={enhancements!r} was accepted")
+
+
+def main():
+    """Run all tests."""
+    print("Joist Calculation Agent Test Suite")
+    print("=" * 50)
+    
+    try:
+        test_enhancement_sections()
+        test_invalid_enhancements()
+        
+        print("\n" + "=" * 50)
+        print("✅ All tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
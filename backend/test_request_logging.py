@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for the request logging middleware
+
+Drives RequestLogMiddleware with a minimal ASGI app (no server needed) and
+checks which access log records come out at different ACCESS_LOG_LEVELs.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from utils.request_logging import RequestLogMiddleware, logger
+
+
+class RecordCollector(logging.Handler):
+    """Keep every record the access logger emits"""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(record)
+
+
+async def demo_app(scope, receive, send):
+    """ASGI app with one missing path and one failing path"""
+    if scope["path"] == "/boom":
+        raise RuntimeError("boom")
+    await send({"type": "http.response.start", "status": 404, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _noop_receive():
+    return {"type": "http.request"}
+
+
+async def _noop_send(message):
+    pass
+
+
+def run_requests(level, paths):
+    """Send GET requests for paths through a fresh middleware at the given level"""
+    collector = RecordCollector()
+    previous_level = logger.level
+    logger.addHandler(collector)
+    logger.setLevel(level)
+    try:
+        middleware = RequestLogMiddleware(demo_app)
+        for path in paths:
+            scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "app": None}
+            try:
+                asyncio.run(middleware(scope, _noop_receive, _noop_send))
+            except RuntimeError:
+                pass
+    finally:
+        logger.removeHandler(collector)
+        logger.setLevel(previous_level)
+    return collector.records
+
+
+def test_warning_level_keeps_404_and_errors():
+    """At WARNING, per-request lines are silenced but 404 warnings and errors are not."""
+    print("\n=== Testing ACCESS_LOG_LEVEL=WARNING ===")
+    
+    records = run_requests(logging.WARNING, ["/missing", "/boom"])
+    messages = [record.getMessage() for record in records]
+    
+    assert not any(record.levelno == logging.INFO for record in records), f"INFO lines at WARNING: {messages}"
+    assert "[WARNING] 404 Not Found for: /missing" in messages, f"404 warning missing: {messages}"
+    assert "[ERROR] Request failed: boom" in messages, f"error record missing: {messages}"
+    print("✓ 404 warning and request error logged, per-request lines silenced")
+
+
+def test_info_level_logs_requests():
+    """At INFO, each request gets its request and response lines."""
+    print("\n=== Testing ACCESS_LOG_LEVEL=INFO ===")
+    
+    records = run_requests(logging.INFO, ["/missing", "/missing"])
+    messages = [record.getMessage() for record in records]
+    
+    assert messages.count("\n[REQUEST] GET /missing") == 2, f"request lines: {messages}"
+    assert sum(message.startswith("[RESPONSE] 404") for message in messages) == 2, f"response lines: {messages}"
+    assert messages.count("[WARNING] 404 Not Found for: /missing") == 1, f"404 should be reported once: {messages}"
+    print("✓ Request and response lines logged, 404 reported once per path")
+
+
+def main():
+    """Run all tests."""
+    print("Request Logging Middleware Test Suite")
+    print("=" * 50)
+    
+    try:
+        test_warning_level_keeps_404_and_errors()
+        test_info_level_logs_requests()
+        
+        print("\n" + "=" * 50)
+        print("✅ All tests completed successfully!")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
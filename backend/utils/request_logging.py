@@ -0,0 +1,98 @@
+"""
+Request logging middleware shared by main.py and main_vercel.py
+
+Written as plain ASGI rather than @app.middleware("http"): Starlette's
+BaseHTTPMiddleware wraps every request in Request/Response objects and an
+extra task group, which costs more than the logging itself on small endpoints.
+
+Records go to the "backend.access" logger through a queue, so formatting and
+stdout writes happen on a listener thread instead of the event loop. The level
+comes from ACCESS_LOG_LEVEL (default INFO); set WARNING to silence per-request
+lines or DEBUG to also list the registered routes on the first 404 of each path.
+"""
+import atexit
+import logging
+import os
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+ACCESS_LOG_LEVEL = os.getenv("ACCESS_LOG_LEVEL", "INFO").upper()
+
+logger = logging.getLogger("backend.access")
+logger.setLevel(ACCESS_LOG_LEVEL)
+logger.propagate = False
+
+_log_queue = queue.SimpleQueue()
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+logger.addHandler(QueueHandler(_log_queue))
+_listener = QueueListener(_log_queue, _stdout_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+# 404 paths already reported; bounded so a client probing random URLs cannot grow it forever
+MAX_LOGGED_404_PATHS = 1024
+
+
+class RequestLogMiddleware:
+    """Log each HTTP request line, its response status and timing"""
+    
+    def __init__(self, app):
+        self.app = app
+        self._route_paths = None
+        self._logged_404_paths = set()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Per-request lines are INFO; below that, skip them and the clock reads.
+        # 404 warnings and request errors are logged at any level that allows them
+        log_requests = logger.isEnabledFor(logging.INFO)
+        start_time = time.perf_counter() if log_requests else 0.0
+        path = scope["path"]
+        
+        # Log the incoming request; the query string is appended only when present.
+        # latin-1 maps every byte, so a malformed query cannot raise here
+        if log_requests:
+            query_string = scope.get("query_string")
+            if query_string:
+                logger.info("\n[REQUEST] %s %s?%s", scope["method"], path, query_string.decode("latin-1"))
+            else:
+                logger.info("\n[REQUEST] %s %s", scope["method"], path)
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                
+                # Log the response
+                if log_requests:
+                    logger.info("[RESPONSE] %s - %.3fs", status, time.perf_counter() - start_time)
+                
+                # Special logging for 404s, once per missing path
+                if status == 404 and path not in self._logged_404_paths:
+                    if len(self._logged_404_paths) >= MAX_LOGGED_404_PATHS:
+                        self._logged_404_paths.clear()
+                    self._logged_404_paths.add(path)
+                    logger.warning("[WARNING] 404 Not Found for: %s", path)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[DEBUG] Available routes:\n%s", "\n".join(self._get_route_paths(scope)))
+            
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            logger.error("[ERROR] Request failed: %s", e)
+            raise
+    
+    def _get_route_paths(self, scope):
+        """Route listing for 404 logs; routes are fixed once the app is serving"""
+        if self._route_paths is None:
+            self._route_paths = tuple(
+                f"  - {route.path}" for route in scope["app"].routes if hasattr(route, 'path')
+            )
+        return self._route_paths